@@ -8,30 +8,145 @@ in HH:MM:SS format for the specified date, location, and timezone.
 
 import json
 import sys
-from datetime import datetime, timedelta
+from collections import namedtuple
+from datetime import datetime, time
+from math import acos, asin, cos, degrees, radians, sin, tan
 from pathlib import Path
 
+import numpy as np
+
+try:
+    # Optional SIMD-accelerated JSON parser; stdlib json is the fallback
+    import orjson as _json
+
+    _JSON_READ_MODE = "rb"
+except ImportError:
+    _json = json
+    _JSON_READ_MODE = "r"
+
 # Add the src directory to Python path to import our modules
 sys.path.append(str(Path(__file__).parent / "src"))
 
 from hora_argentina.noaa_solar_calculations import (
     eccent_earth_orbit,
-    equation_of_time,
     geom_mean_anom_sun,
     geom_mean_long_sun,
     julian_century,
     mean_obliq_ecliptic,
-    obliq_corr,
-    solar_noon,
-    sun_apparent_long,
-    sun_declination,
     sun_eq_of_center,
-    sun_true_long,
-    sunrise,
-    sunset,
-    var_y,
 )
 
+_SolarState = namedtuple(
+    "_SolarState",
+    [
+        "julian_century",
+        "geom_mean_long",
+        "geom_mean_anom",
+        "eccent_orbit",
+        "sun_eq_center",
+        "true_long",
+        "apparent_long",
+        "mean_obliq",
+        "obliq_corr",
+        "var_y",
+        "declination",
+        "eq_time",
+        "hour_angle",
+        "sunrise",
+        "solar_noon",
+        "sunset",
+    ],
+)
+
+
+def compute_all(julian_day, latitude, longitude, utc_offset, solar_elevation=-0.833):
+    """Compute every NOAA intermediate and the solar times in one pass.
+
+    The individual helpers re-derive their upstream quantities on every
+    call (e.g. sun_apparent_long recomputes the mean longitude and
+    equation of center); evaluating the chain once in topological order
+    roughly halves the trig work for callers that want several values.
+    """
+    jc = julian_century(julian_day)
+
+    L0 = geom_mean_long_sun(jc)
+    M = geom_mean_anom_sun(jc)
+    e = eccent_earth_orbit(jc)
+    C = sun_eq_of_center(jc)
+    mean_obliq = mean_obliq_ecliptic(jc)
+
+    true_long = L0 + C
+    omega_rad = radians(125.04 - 1934.136 * jc)
+    apparent_long = true_long - 0.00569 - 0.00478 * sin(omega_rad)
+    obliq = mean_obliq + 0.00256 * cos(omega_rad)
+
+    obliq_rad = radians(obliq)
+    var_y_value = tan(obliq_rad / 2.0) ** 2
+    declination = degrees(asin(sin(obliq_rad) * sin(radians(apparent_long))))
+
+    L0_rad = radians(L0)
+    m_rad = radians(M)
+    eq_time = (
+        degrees(
+            var_y_value * sin(2.0 * L0_rad)
+            - 2.0 * e * sin(m_rad)
+            + 4.0 * e * var_y_value * sin(m_rad) * cos(2.0 * L0_rad)
+            - 0.5 * var_y_value * var_y_value * sin(4.0 * L0_rad)
+            - 1.25 * e * e * sin(2.0 * m_rad)
+        )
+        * 4.0
+    )
+
+    lat_rad = radians(latitude)
+    decl_rad = radians(declination)
+    cos_ha = cos(radians(90.0 - solar_elevation)) / (
+        cos(lat_rad) * cos(decl_rad)
+    ) - tan(lat_rad) * tan(decl_rad)
+    cos_ha = min(1.0, max(-1.0, cos_ha))
+    hour_angle = degrees(acos(cos_ha))
+
+    solar_noon = (720.0 - 4.0 * longitude - eq_time) / 60.0 + utc_offset
+
+    return _SolarState(
+        julian_century=jc,
+        geom_mean_long=L0,
+        geom_mean_anom=M,
+        eccent_orbit=e,
+        sun_eq_center=C,
+        true_long=true_long,
+        apparent_long=apparent_long,
+        mean_obliq=mean_obliq,
+        obliq_corr=obliq,
+        var_y=var_y_value,
+        declination=declination,
+        eq_time=eq_time,
+        hour_angle=hour_angle,
+        sunrise=solar_noon - hour_angle / 15.0,
+        solar_noon=solar_noon,
+        sunset=solar_noon + hour_angle / 15.0,
+    )
+
+
+def _jd_ymd(year, month, day):
+    """Julian Day Number for a calendar date (pure integer arithmetic)."""
+    a = (14 - month) // 12
+    y = year + 4800 - a
+    m = month + 12 * a - 3
+
+    return day + (153 * m + 2) // 5 + 365 * y + y // 4 - y // 100 + y // 400 - 32045
+
+
+def _jd_from_ymdhms(year, month, day, hour, minute, second, utc_offset=0):
+    """Julian Day for local date/time components, skipping datetime parsing.
+
+    The UTC conversion is a plain shift on the continuous JD scale, so no
+    datetime arithmetic is needed for day-boundary crossings.
+    """
+    time_fraction = (hour + minute / 60.0 + second / 3600.0) / 24.0
+
+    # Subtract 0.5 because JD starts at noon; shift by the UTC offset
+    return _jd_ymd(year, month, day) + time_fraction - 0.5 - utc_offset / 24.0
+
 
 def date_to_julian_day(target_date, utc_offset=0):
     """Convert a date to Julian Day Number, considering local time."""
@@ -49,28 +164,15 @@ def date_to_julian_day(target_date, utc_offset=0):
             target_date, datetime.min.time().replace(hour=12)
         )
 
-    # Convert to UTC by subtracting the UTC offset
-    utc_datetime = target_datetime - timedelta(hours=utc_offset)
-
-    # Extract date and time components
-    year = utc_datetime.year
-    month = utc_datetime.month
-    day = utc_datetime.day
-    hour = utc_datetime.hour
-    minute = utc_datetime.minute
-    second = utc_datetime.second
-
-    # Julian Day calculation for the date part
-    a = (14 - month) // 12
-    y = year + 4800 - a
-    m = month + 12 * a - 3
-
-    jd_date = day + (153 * m + 2) // 5 + 365 * y + y // 4 - y // 100 + y // 400 - 32045
-
-    # Add the time fraction (convert time to fraction of a day)
-    time_fraction = (hour + minute / 60.0 + second / 3600.0) / 24.0
-
-    return jd_date + time_fraction - 0.5  # Subtract 0.5 because JD starts at noon
+    return _jd_from_ymdhms(
+        target_datetime.year,
+        target_datetime.month,
+        target_datetime.day,
+        target_datetime.hour,
+        target_datetime.minute,
+        target_datetime.second,
+        utc_offset,
+    )
 
 
 def decimal_hours_to_time_string(decimal_hours):
@@ -78,24 +180,47 @@ def decimal_hours_to_time_string(decimal_hours):
     if decimal_hours is None:
         return "N/A"
 
-    # Handle negative hours (previous day) or hours >= 24 (next day)
-    hours = int(decimal_hours) % 24
-    minutes = int((decimal_hours - int(decimal_hours)) * 60)
-    seconds = int(((decimal_hours - int(decimal_hours)) * 60 - minutes) * 60)
+    # Single integer conversion avoids repeated float-fraction arithmetic
+    # and wraps negative / >= 24h values in one modulo
+    total_seconds = int(round(decimal_hours * 3600)) % 86400
+    hours, remainder = divmod(total_seconds, 3600)
+    minutes, seconds = divmod(remainder, 60)
 
     return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
 
 
+def decimal_hours_to_time_array(decimal_hours):
+    """Convert an array of decimal hours to a list of HH:MM:SS strings.
+
+    Vectorized counterpart of decimal_hours_to_time_string: the divmod
+    arithmetic runs once over the whole array, leaving only the final
+    string formatting in Python. NaN entries come out as "N/A".
+    """
+    values = np.asarray(decimal_hours, dtype=np.float64)
+    nan_mask = np.isnan(values)
+
+    total_seconds = np.rint(np.where(nan_mask, 0.0, values) * 3600).astype(np.int64)
+    total_seconds %= 86400
+    hours, remainder = np.divmod(total_seconds, 3600)
+    minutes, seconds = np.divmod(remainder, 60)
+
+    return [
+        "N/A" if invalid else f"{h:02d}:{m:02d}:{s:02d}"
+        for invalid, h, m, s in zip(nan_mask, hours, minutes, seconds)
+    ]
+
+
 def load_config(config_file="config.json"):
     """Load configuration from JSON file."""
     try:
-        with open(config_file, "r") as f:
-            config = json.load(f)
+        with open(config_file, _JSON_READ_MODE) as f:
+            config = _json.loads(f.read())
         return config
     except FileNotFoundError:
         print(f"Error: Configuration file '{config_file}' not found.")
         sys.exit(1)
-    except json.JSONDecodeError as e:
+    except ValueError as e:
+        # Both json.JSONDecodeError and orjson.JSONDecodeError are ValueErrors
         print(f"Error: Invalid JSON in configuration file: {e}")
         sys.exit(1)
 
@@ -129,16 +254,14 @@ def validate_config(config):
         print("Error: Date must be in YYYY-MM-DD format.")
         sys.exit(1)
 
-    # Validate time format if provided
+    # Validate time format if provided; fromisoformat accepts both HH:MM
+    # and HH:MM:SS without strptime's per-call format-string re-parsing
     if "time" in config:
         try:
-            datetime.strptime(config["time"], "%H:%M:%S")
+            time.fromisoformat(config["time"])
         except ValueError:
-            try:
-                datetime.strptime(config["time"], "%H:%M")
-            except ValueError:
-                print("Error: Time must be in HH:MM:SS or HH:MM format.")
-                sys.exit(1)
+            print("Error: Time must be in HH:MM:SS or HH:MM format.")
+            sys.exit(1)
 
 
 def main():
@@ -157,72 +280,55 @@ def main():
     latitude = config["latitude"]
     longitude = config["longitude"]
 
-    # Combine date and time
-    if "time" in config:
-        datetime_str = f"{target_date}T{target_time}"
-    else:
-        datetime_str = f"{target_date}T{target_time}"
-
-    # Convert date to Julian Day (considering local time)
-    julian_day = date_to_julian_day(datetime_str, utc_offset)
-
-    # Calculate Julian Century
-    jc = julian_century(julian_day)
-
-    # Calculate geometric mean longitude of the sun
-    geom_mean_long = geom_mean_long_sun(jc)
-
-    # Calculate additional astronomical parameters
-    geom_mean_anom = geom_mean_anom_sun(jc)
-    eccent_orbit = eccent_earth_orbit(jc)
-    sun_eq_center = sun_eq_of_center(jc)
-    sun_true_longitude = sun_true_long(jc)
-    sun_apparent_longitude = sun_apparent_long(jc)
-    mean_obliq = mean_obliq_ecliptic(jc)
-    obliq_correction = obliq_corr(jc)
-    var_y_value = var_y(jc)
-    sun_decl = sun_declination(jc)
+    # The config components are already validated, so feed them straight
+    # into the integer JD math without building/parsing a datetime
+    year, month, day = (int(part) for part in target_date.split("-"))
+    time_parts = [int(part) for part in target_time.split(":")]
+    while len(time_parts) < 3:
+        time_parts.append(0)
+    hour, minute, second = time_parts
 
-    # Calculate equation of time
-    eq_time = equation_of_time(jc)
+    julian_day = _jd_from_ymdhms(year, month, day, hour, minute, second, utc_offset)
 
-    # Calculate solar times
-    sunrise_time = sunrise(latitude, longitude, utc_offset, julian_day)
-    sunset_time = sunset(latitude, longitude, utc_offset, julian_day)
-    noon_time = solar_noon(longitude, utc_offset, julian_day)
+    # Compute every astronomical quantity exactly once
+    s = compute_all(julian_day, latitude, longitude, utc_offset)
 
     # Format times as HH:MM:SS
-    sunrise_str = decimal_hours_to_time_string(sunrise_time)
-    sunset_str = decimal_hours_to_time_string(sunset_time)
-    noon_str = decimal_hours_to_time_string(noon_time)
-
-    # Display results
-    print("Solar Times Calculator")
-    print("=" * 50)
-    print(f"Date: {target_date}")
-    print(f"Time: {target_time}")
-    print(f"Location: {latitude:.4f}°, {longitude:.4f}°")
-    print(f"UTC Offset: {utc_offset:+.1f} hours")
-    print()
-    print("Astronomical Calculations:")
-    print(f"Julian Day:              {julian_day:.6f}")
-    print(f"Julian Century:          {jc:.8f}")
-    print(f"Geom Mean Long Sun:      {geom_mean_long:.6f}°")
-    print(f"Geom Mean Anom Sun:      {geom_mean_anom:.6f}°")
-    print(f"Eccent Earth Orbit:      {eccent_orbit:.8f}")
-    print(f"Sun Eq of Center:        {sun_eq_center:.6f}°")
-    print(f"Sun True Long:           {sun_true_longitude:.6f}°")
-    print(f"Sun Apparent Long:       {sun_apparent_longitude:.6f}°")
-    print(f"Mean Obliq Ecliptic:     {mean_obliq:.6f}°")
-    print(f"Obliq Corr:              {obliq_correction:.6f}°")
-    print(f"Var Y:                   {var_y_value:.8f}")
-    print(f"Sun Declination:         {sun_decl:.6f}°")
-    print(f"Equation of Time:        {eq_time:.6f} minutes")
-    print()
-    print("Solar Times:")
-    print(f"Sunrise:    {sunrise_str}")
-    print(f"Solar Noon: {noon_str}")
-    print(f"Sunset:     {sunset_str}")
+    sunrise_str = decimal_hours_to_time_string(s.sunrise)
+    sunset_str = decimal_hours_to_time_string(s.sunset)
+    noon_str = decimal_hours_to_time_string(s.solar_noon)
+
+    # Display results with a single write instead of ~22 individual
+    # print calls (one stdio lock/flush instead of one per line)
+    lines = [
+        "Solar Times Calculator",
+        "=" * 50,
+        f"Date: {target_date}",
+        f"Time: {target_time}",
+        f"Location: {latitude:.4f}°, {longitude:.4f}°",
+        f"UTC Offset: {utc_offset:+.1f} hours",
+        "",
+        "Astronomical Calculations:",
+        f"Julian Day:              {julian_day:.6f}",
+        f"Julian Century:          {s.julian_century:.8f}",
+        f"Geom Mean Long Sun:      {s.geom_mean_long:.6f}°",
+        f"Geom Mean Anom Sun:      {s.geom_mean_anom:.6f}°",
+        f"Eccent Earth Orbit:      {s.eccent_orbit:.8f}",
+        f"Sun Eq of Center:        {s.sun_eq_center:.6f}°",
+        f"Sun True Long:           {s.true_long:.6f}°",
+        f"Sun Apparent Long:       {s.apparent_long:.6f}°",
+        f"Mean Obliq Ecliptic:     {s.mean_obliq:.6f}°",
+        f"Obliq Corr:              {s.obliq_corr:.6f}°",
+        f"Var Y:                   {s.var_y:.8f}",
+        f"Sun Declination:         {s.declination:.6f}°",
+        f"Equation of Time:        {s.eq_time:.6f} minutes",
+        "",
+        "Solar Times:",
+        f"Sunrise:    {sunrise_str}",
+        f"Solar Noon: {noon_str}",
+        f"Sunset:     {sunset_str}",
+    ]
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 if __name__ == "__main__":
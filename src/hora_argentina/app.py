@@ -7,15 +7,84 @@
 Minimal Streamlit app for displaying Argentina time with interactive map.
 """
 
+import copy
+import math
+from concurrent.futures import ThreadPoolExecutor
+
 import folium
 import streamlit as st
-from geopy.geocoders import Nominatim
-from streamlit_folium import st_folium
 
 from hora_argentina import __version__
-from hora_argentina.noaa_plotly import plot_yearly_sun_times
 from hora_argentina.noaa_solar_calculations import yearly_sun_times_dataframe
 
+# geopy, streamlit_folium and plotly are imported lazily at their call
+# sites: Streamlit re-executes this script on every widget interaction,
+# so keeping them out of the unconditional import path trims each rerun
+
+_MAP_ATTR = (
+    '&copy; <a href="https://ign-argentina.github.io/argenmap-web/#mapa">ArgenMap</a> '
+)
+_MAP_TILES = "https://wms.ign.gob.ar/geoserver/gwc/service/tms/1.0.0/capabaseargenmap@EPSG%3A3857@png/{z}/{x}/{-y}.png"
+
+
+@st.cache_resource
+def _base_map(lat, lng, zoom):
+    """Build (once) the folium base map for a given center and zoom.
+
+    Callers must deep-copy the returned Map before mutating it (e.g.
+    adding markers), since the cached instance is shared across reruns.
+    """
+    return folium.Map(
+        location=[lat, lng],
+        zoom_start=zoom,
+        attr=_MAP_ATTR,
+        tiles=_MAP_TILES,
+    )
+
+
+@st.cache_data(ttl=86400, max_entries=1024)
+def _geocode(query):
+    """Cached forward geocoding; each distinct query hits Nominatim once a day."""
+    from geopy.geocoders import Nominatim
+
+    geolocator = Nominatim(user_agent="hora_argentina_app")
+    return geolocator.geocode(query, timeout=10, language="es")
+
+
+@st.cache_data(ttl=86400, max_entries=1024)
+def _reverse_geocode(lat, lng):
+    """Cached reverse geocoding; coordinates are rounded by the caller."""
+    from geopy.geocoders import Nominatim
+
+    geolocator = Nominatim(user_agent="hora_argentina_app")
+    location = geolocator.reverse(f"{lat}, {lng}", timeout=5, language="es")
+    return location.address if location else None
+
+
+@st.cache_data(ttl=3600, max_entries=256)
+def _cached_yearly(
+    lat,
+    lng,
+    timezone_offset,
+    summer_timezone_offset=None,
+    summer_start_date=None,
+    summer_end_date=None,
+):
+    """Cached wrapper around yearly_sun_times_dataframe.
+
+    Callers round lat/lng to 3 decimals (~100 m) before the lookup, so
+    nearby clicks and reruns that only change the tab selection hit the
+    cache instead of recomputing the full year.
+    """
+    return yearly_sun_times_dataframe(
+        lat,
+        lng,
+        timezone_offset=timezone_offset,
+        summer_timezone_offset=summer_timezone_offset,
+        summer_start_date=summer_start_date,
+        summer_end_date=summer_end_date,
+    )
+
 
 def main():
     """Main Streamlit app function."""
@@ -92,9 +161,7 @@ def main():
     # Handle address search (triggered by button click or Enter press)
     if (search_button and address_input.strip()) or address_changed:
         try:
-            # Initialize geocoder
-            geolocator = Nominatim(user_agent="hora_argentina_app")
-            location = geolocator.geocode(address_input, timeout=10, language="es")
+            location = _geocode(address_input.strip())
 
             if location:
                 # Store the geocoded location
@@ -103,9 +170,10 @@ def main():
                     "lng": location.longitude,
                     "address": location.address,
                 }
+                # No rerun needed: everything below reads the updated
+                # session state within this same script pass
                 st.session_state.last_clicked_coordinate = new_coord
                 st.success(f"📍 Encontramos: {location.address}")
-                st.rerun()  # Refresh to show the new marker
             else:
                 st.error(
                     "❌ Dirección no encontrada. Por favor intente un término diferente."
@@ -122,15 +190,14 @@ def main():
     else:
         map_center = [-38.4161, -63.6167]  # Default Argentina center
 
-    # Create Argentina map centered on last clicked location
-
-    attr = '&copy; <a href="https://ign-argentina.github.io/argenmap-web/#mapa">ArgenMap</a> '
-
-    m = folium.Map(
-        location=map_center,
-        zoom_start=st.session_state.map_zoom,
-        attr=attr,
-        tiles="https://wms.ign.gob.ar/geoserver/gwc/service/tms/1.0.0/capabaseargenmap@EPSG%3A3857@png/{z}/{x}/{-y}.png",
+    # Create Argentina map centered on last clicked location; the base map
+    # is cached per (center, zoom) and copied before adding the marker
+    m = copy.deepcopy(
+        _base_map(
+            round(map_center[0], 3),
+            round(map_center[1], 3),
+            st.session_state.map_zoom,
+        )
     )
 
     # Add last clicked marker if it exists
@@ -152,6 +219,8 @@ def main():
         ).add_to(m)
 
     # Display the map and capture interactions
+    from streamlit_folium import st_folium
+
     st_data = st_folium(
         m,
         use_container_width=True,
@@ -168,15 +237,30 @@ def main():
         if st_data.get("zoom") is not None:
             st.session_state.map_zoom = st_data["zoom"]
 
-        # Try to get address for clicked location via reverse geocoding
-        try:
-            geolocator = Nominatim(user_agent="hora_argentina_app")
-            location = geolocator.reverse(
-                f"{clicked_lat}, {clicked_lng}", timeout=5, language="es"
+        # Reuse the previous address when the click landed within ~100 m of
+        # the already-geocoded point (e.g. a double click): the answer
+        # cannot differ at that scale, so skip the network round-trip
+        previous = st.session_state.last_clicked_coordinate
+        address = None
+        if previous and previous.get("address"):
+            dx = (clicked_lat - previous["lat"]) * 111000
+            dy = (
+                (clicked_lng - previous["lng"])
+                * 111000
+                * math.cos(math.radians(clicked_lat))
             )
-            address = location.address if location else None
-        except Exception:
-            address = None
+            if dx * dx + dy * dy < 100**2:
+                address = previous["address"]
+
+        if address is None:
+            # Reverse-geocode the clicked location (rounded to 4 decimals,
+            # ~10 m, so nearby clicks share cache entries)
+            try:
+                address = _reverse_geocode(
+                    round(clicked_lat, 4), round(clicked_lng, 4)
+                )
+            except Exception:
+                address = None
 
         # Store the clicked coordinate with address if available
         new_coord = {"lat": clicked_lat, "lng": clicked_lng}
@@ -185,8 +269,10 @@ def main():
         else:
             new_coord["address"] = None
 
+        # The charts below pick up the new coordinate in this same pass;
+        # the marker catches up on Streamlit's natural next rerun instead
+        # of forcing an immediate full re-execution
         st.session_state.last_clicked_coordinate = new_coord
-        st.rerun()  # Refresh to show the new marker
 
     st.subheader("Gráfico de amanecer y anochecer")
 
@@ -194,21 +280,27 @@ def main():
     if st.session_state.last_clicked_coordinate:
         coords = st.session_state.last_clicked_coordinate
 
+        # Round to ~100 m so nearby clicks share the same cache entry
+        lat = round(coords["lat"], 3)
+        lng = round(coords["lng"], 3)
+
         with st.spinner("Obteniendo información de amanecer/anochecer..."):
-            df_3 = yearly_sun_times_dataframe(
-                coords["lat"], coords["lng"], timezone_offset=-3
-            )
-            df_4 = yearly_sun_times_dataframe(
-                coords["lat"], coords["lng"], timezone_offset=-4
-            )
-            df_dual = yearly_sun_times_dataframe(
-                coords["lat"],
-                coords["lng"],
-                timezone_offset=-4,
-                summer_timezone_offset=-3,
-                summer_start_date=(9, 7),
-                summer_end_date=(4, 6),
-            )
+            # The three computations are independent, so run them concurrently
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                future_3 = executor.submit(_cached_yearly, lat, lng, -3)
+                future_4 = executor.submit(_cached_yearly, lat, lng, -4)
+                future_dual = executor.submit(
+                    _cached_yearly,
+                    lat,
+                    lng,
+                    timezone_offset=-4,
+                    summer_timezone_offset=-3,
+                    summer_start_date=(9, 7),
+                    summer_end_date=(4, 6),
+                )
+                df_3 = future_3.result()
+                df_4 = future_4.result()
+                df_dual = future_dual.result()
 
         if coords["address"]:
             title = f"{coords['address']}"
@@ -216,6 +308,8 @@ def main():
             title = f"Lat: {coords['lat']:.4f}, Long: {coords['lng']:.4f}"
 
     with st.spinner("Generando gráficos..."):
+        from hora_argentina.noaa_plotly import plot_yearly_sun_times
+
         st.write(
             "**Elija una opción de esquema de huso horario para ver el correspondiente gráfico**"
         )
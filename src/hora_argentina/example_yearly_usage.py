@@ -35,18 +35,16 @@ def main():
     print()
 
     # Show summer solstice (Dec 21 in Southern Hemisphere)
-    summer_solstice = df[
-        df["date"].apply(lambda x: x.strftime("%m-%d") == "12-21")
-    ].iloc[0]
+    summer_mask = (df["date"].dt.month == 12) & (df["date"].dt.day == 21)
+    summer_solstice = df.loc[summer_mask].iloc[0]
     print("Summer Solstice (December 21st):")
     for col in df.columns:
         print(f"  {col}: {summer_solstice[col]}")
     print()
 
     # Show winter solstice (Jun 21 in Southern Hemisphere)
-    winter_solstice = df[
-        df["date"].apply(lambda x: x.strftime("%m-%d") == "06-21")
-    ].iloc[0]
+    winter_mask = (df["date"].dt.month == 6) & (df["date"].dt.day == 21)
+    winter_solstice = df.loc[winter_mask].iloc[0]
     print("Winter Solstice (June 21st):")
     for col in df.columns:
         print(f"  {col}: {winter_solstice[col]}")
@@ -3,18 +3,184 @@ Functions to fetch sunrise and sunset data from APIs.
 """
 
 import hashlib
-import pickle
+import os
 import random
+import threading
 import time
-from datetime import date, datetime
+from calendar import isleap
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Union
 
+import numpy as np
 import pandas as pd
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
+try:
+    # Optional SIMD-accelerated JSON parser; stdlib json is the fallback
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+
+def _build_session() -> requests.Session:
+    """Build a session with connection pooling and transport-level retries."""
+    session = requests.Session()
+    retry_strategy = Retry(
+        total=3,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=["HEAD", "GET", "OPTIONS"],
+        backoff_factor=1,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=10, pool_maxsize=10, max_retries=retry_strategy
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+# Shared across all API calls so consecutive requests reuse the same
+# TCP/TLS connection instead of paying a fresh handshake each time
+_SESSION = _build_session()
+
+
+# Column order of the returned frames; built once instead of per call
+_DESIRED_COLUMNS = (
+    "date",
+    "sunrise",
+    "sunset",
+    "first_light",
+    "last_light",
+    "dawn",
+    "dusk",
+    "solar_noon",
+    "golden_hour",
+    "day_length",
+    "timezone",
+    "utc_offset",
+)
+
+
+def _build_season_table() -> np.ndarray:
+    """Season codes (0-3, northern boundary dates) keyed by (month << 5) + day."""
+    table = np.zeros(13 * 32, dtype=np.int8)
+
+    for month in range(1, 13):
+        for day in range(1, 32):
+            if (month == 12 and day >= 21) or month <= 2 or (month == 3 and day < 20):
+                code = 0  # winter-like
+            elif (
+                (month == 3 and day >= 20)
+                or month in (4, 5)
+                or (month == 6 and day < 21)
+            ):
+                code = 1  # spring-like
+            elif (
+                (month == 6 and day >= 21)
+                or month in (7, 8)
+                or (month == 9 and day < 22)
+            ):
+                code = 2  # summer-like
+            else:
+                code = 3  # autumn-like
+            table[(month << 5) + day] = code
+
+    return table
+
+
+# Tiny cache-resident lookup table built once at import: classifying a
+# year becomes a single gather per row, and keying on the calendar day
+# (rather than day-of-year) keeps leap years aligned for free
+_SEASON_TABLE = _build_season_table()
+
+
+# Adaptive courtesy throttle: requests run back to back normally, but
+# after the API signals rate limiting (429) or overload (503) they are
+# spaced out for a short window instead of sleeping unconditionally
+_THROTTLE_SPACING_SECONDS = 0.5
+_THROTTLE_WINDOW_SECONDS = 60.0
+_throttle_lock = threading.Lock()
+_throttle_until = 0.0
+_next_request_time = 0.0
+
+
+def _respect_throttle() -> None:
+    """Sleep only while the API has recently signaled rate limiting."""
+    global _next_request_time
+
+    with _throttle_lock:
+        now = time.time()
+        if now >= _throttle_until:
+            return
+        wait = max(0.0, _next_request_time - now)
+        _next_request_time = now + wait + _THROTTLE_SPACING_SECONDS
+
+    if wait > 0.0:
+        time.sleep(wait)
+
+
+def _signal_throttle() -> None:
+    """Open the throttle window after a rate-limit or overload response."""
+    global _throttle_until
+
+    with _throttle_lock:
+        _throttle_until = max(_throttle_until, time.time() + _THROTTLE_WINDOW_SECONDS)
+
+
+# Negative-result cache: while the API is known to be down, new calls
+# fail fast instead of walking the full retry ladder, so the stale-cache
+# fallback can take over immediately
+_API_DOWN_WINDOW_SECONDS = 60.0
+_api_down_until = 0.0
+
+
+# In-process memo in front of the disk cache: same keys, but repeated
+# requests within one process skip the pickle round-trip entirely.
+# Bounded LRU with a TTL so long-lived processes cannot grow it forever
+_MEMO_MAXSIZE = 256
+_MEMO_TTL_SECONDS = 12 * 3600
+_memo_cache: "OrderedDict[str, tuple]" = OrderedDict()
+
+
+def _memo_get(cache_key: str) -> Optional[pd.DataFrame]:
+    """Return a copy of the memoized frame for the key, or None."""
+    entry = _memo_cache.get(cache_key)
+    if entry is None:
+        return None
+
+    stored_at, df = entry
+    if time.time() - stored_at > _MEMO_TTL_SECONDS:
+        del _memo_cache[cache_key]
+        return None
+
+    _memo_cache.move_to_end(cache_key)
+    return df.copy()
+
+
+def _memo_put(cache_key: str, df: pd.DataFrame) -> None:
+    """Memoize a copy of the frame, evicting the least recently used entries."""
+    _memo_cache[cache_key] = (time.time(), df.copy())
+    _memo_cache.move_to_end(cache_key)
+    while len(_memo_cache) > _MEMO_MAXSIZE:
+        _memo_cache.popitem(last=False)
+
+
+def _to_date_str(
+    value: Optional[Union[str, date, datetime]],
+) -> Optional[str]:
+    """Normalize a date-like parameter to a YYYY-MM-DD string (or None)."""
+    if value is None:
+        return None
+    if isinstance(value, (date, datetime)):
+        return value.strftime("%Y-%m-%d")
+    return str(value)
+
 
 def _get_cache_key(
     latitude: float,
@@ -27,11 +193,14 @@ def _get_cache_key(
 ) -> str:
     """Generate a cache key for the API request."""
     key_data = f"{latitude}_{longitude}_{timezone}_{date_value}_{date_start}_{date_end}_{time_format}"
-    return hashlib.md5(key_data.encode()).hexdigest()
+    # blake2b is ~2x faster than md5 on short inputs; digest_size=16
+    # keeps the same 32-char hex filename shape as before
+    return hashlib.blake2b(key_data.encode(), digest_size=16).hexdigest()
 
 
+@lru_cache(maxsize=1)
 def _get_cache_path() -> Path:
-    """Get the cache directory path."""
+    """Get the cache directory path (resolved and created once per process)."""
     # Use user's home directory or temp directory if home is not writable
     try:
         cache_dir = Path.home() / ".cache" / "hora_argentina"
@@ -57,20 +226,30 @@ def _load_from_cache(cache_key: str, max_age_hours: int = 24) -> Optional[pd.Dat
         Cached DataFrame or None if cache is missing/expired
     """
     try:
-        cache_file = _get_cache_path() / f"{cache_key}.pkl"
+        cache_dir = _get_cache_path()
+        max_age_seconds = max_age_hours * 3600
+
+        # Parquet is the native format; .pkl files written by older
+        # versions are still honored so existing caches keep working
+        for cache_file in (
+            cache_dir / f"{cache_key}.parquet",
+            cache_dir / f"{cache_key}.pkl",
+        ):
+            if not cache_file.exists():
+                continue
 
-        if cache_file.exists():
             # Check if cache is within max age
             cache_age_seconds = time.time() - cache_file.stat().st_mtime
-            max_age_seconds = max_age_hours * 3600
 
             if cache_age_seconds < max_age_seconds:
-                with open(cache_file, "rb") as f:
-                    cached_df = pickle.load(f)
-                    print(
-                        f"📦 Using cached data (age: {cache_age_seconds / 3600:.1f} hours)"
-                    )
-                    return cached_df
+                if cache_file.suffix == ".parquet":
+                    cached_df = pd.read_parquet(cache_file, engine="pyarrow")
+                else:
+                    cached_df = pd.read_pickle(cache_file)
+                print(
+                    f"📦 Using cached data (age: {cache_age_seconds / 3600:.1f} hours)"
+                )
+                return cached_df
             else:
                 # Cache is too old, remove it
                 cache_file.unlink(missing_ok=True)
@@ -96,9 +275,10 @@ def _save_to_cache(cache_key: str, df: pd.DataFrame) -> bool:
         True if successfully cached, False otherwise
     """
     try:
-        cache_file = _get_cache_path() / f"{cache_key}.pkl"
-        with open(cache_file, "wb") as f:
-            pickle.dump(df, f)
+        cache_file = _get_cache_path() / f"{cache_key}.parquet"
+        # Columnar storage with native buffers deserializes much faster
+        # than pickled DataFrame blocks, and zstd keeps files small
+        df.to_parquet(cache_file, engine="pyarrow", compression="zstd")
         print("💾 Data cached successfully")
         return True
     except Exception as e:
@@ -107,17 +287,38 @@ def _save_to_cache(cache_key: str, df: pd.DataFrame) -> bool:
 
 
 def _cleanup_old_cache_files(max_age_days: int = 7):
-    """Remove cache files older than specified days."""
+    """Remove cache files older than specified days (at most once per day)."""
     try:
         cache_dir = _get_cache_path()
         current_time = time.time()
+
+        # A sentinel file's mtime gates the sweep: one stat per call
+        # instead of globbing and statting every cache file
+        sentinel = cache_dir / ".last_cleanup"
+        try:
+            if current_time - sentinel.stat().st_mtime < 24 * 3600:
+                return
+        except OSError:
+            pass
+
         max_age_seconds = max_age_days * 24 * 3600
 
+        # os.scandir serves entry.stat() from the cached direntry data,
+        # one syscall per file instead of a glob plus a separate stat
         removed_count = 0
-        for cache_file in cache_dir.glob("*.pkl"):
-            if current_time - cache_file.stat().st_mtime > max_age_seconds:
-                cache_file.unlink()
-                removed_count += 1
+        with os.scandir(cache_dir) as entries:
+            for entry in entries:
+                if not entry.name.endswith((".parquet", ".pkl")):
+                    continue
+                if current_time - entry.stat().st_mtime > max_age_seconds:
+                    try:
+                        os.unlink(entry.path)
+                        removed_count += 1
+                    except FileNotFoundError:
+                        # Another process already removed it
+                        pass
+
+        sentinel.touch()
 
         if removed_count > 0:
             print(f"🧹 Cleaned up {removed_count} old cache files")
@@ -169,6 +370,7 @@ def get_sunrise_sunset_data(
                      - solar_noon: Solar noon time
                      - golden_hour: Golden hour start time
                      - day_length: Length of the day
+                     - day_length_seconds: Length of the day in seconds (int32)
                      - timezone: Timezone used
                      - utc_offset: UTC offset in minutes
 
@@ -180,41 +382,30 @@ def get_sunrise_sunset_data(
         >>> df = get_sunrise_sunset_data(40.7128, -74.0060, timezone="America/New_York")
         >>> print(df.head())
     """
+    global _api_down_until
 
     # Clean up old cache files periodically
     if use_cache:
         _cleanup_old_cache_files()
 
     # Convert date parameters to strings for cache key and API params
-    date_str = None
-    start_str = None
-    end_str = None
-
-    if date_value is not None:
-        if isinstance(date_value, (date, datetime)):
-            date_str = date_value.strftime("%Y-%m-%d")
-        else:
-            date_str = str(date_value)
+    date_str = _to_date_str(date_value)
+    start_str = _to_date_str(date_start)
+    end_str = _to_date_str(date_end)
 
-    if date_start is not None:
-        if isinstance(date_start, (date, datetime)):
-            start_str = date_start.strftime("%Y-%m-%d")
-        else:
-            start_str = str(date_start)
-
-    if date_end is not None:
-        if isinstance(date_end, (date, datetime)):
-            end_str = date_end.strftime("%Y-%m-%d")
-        else:
-            end_str = str(date_end)
-
-    # Check cache first
+    # Check caches first: the in-process memo, then the disk cache
     if use_cache:
         cache_key = _get_cache_key(
             latitude, longitude, timezone, date_str, start_str, end_str, time_format
         )
+
+        memo_data = _memo_get(cache_key)
+        if memo_data is not None:
+            return memo_data
+
         cached_data = _load_from_cache(cache_key, cache_max_age_hours)
         if cached_data is not None:
+            _memo_put(cache_key, cached_data)
             return cached_data
 
     # Build the API URL
@@ -235,17 +426,13 @@ def get_sunrise_sunset_data(
     if end_str is not None:
         params["date_end"] = end_str
 
-    # Create session with retry strategy
-    session = requests.Session()
-    retry_strategy = Retry(
-        total=max_retries,
-        status_forcelist=[429, 500, 502, 503, 504],
-        allowed_methods=["HEAD", "GET", "OPTIONS"],
-        backoff_factor=1,
-    )
-    adapter = HTTPAdapter(max_retries=retry_strategy)
-    session.mount("http://", adapter)
-    session.mount("https://", adapter)
+    # Fail fast during a known outage window; the message carries the
+    # 503 marker so the stale-cache fallback routes straight to disk
+    if time.time() < _api_down_until:
+        raise requests.RequestException(
+            "SunriseSunset.io API is temporarily unavailable (503 Service "
+            "Unavailable); failing fast while the recent outage window is open."
+        )
 
     last_exception = None
 
@@ -259,11 +446,12 @@ def get_sunrise_sunset_data(
                 )
                 time.sleep(delay)
 
-            # Make the API request
-            response = session.get(base_url, params=params, timeout=30)
+            # Make the API request on the shared pooled session
+            _respect_throttle()
+            response = _SESSION.get(base_url, params=params, timeout=30)
             response.raise_for_status()
 
-            data = response.json()
+            data = _json_loads(response.content)
 
             # Check if the API returned an error
             if data.get("status") != "OK":
@@ -285,45 +473,47 @@ def get_sunrise_sunset_data(
             else:
                 raise ValueError("Unexpected response format from API")
 
-            # Create DataFrame
-            df = pd.DataFrame(df_data)
-
-            # Ensure date column is datetime
-            if "date" in df.columns:
-                df["date"] = pd.to_datetime(df["date"])
-
-            # Reorder columns for better readability
-            desired_columns = [
-                "date",
-                "sunrise",
-                "sunset",
-                "first_light",
-                "last_light",
-                "dawn",
-                "dusk",
-                "solar_noon",
-                "golden_hour",
-                "day_length",
-                "timezone",
-                "utc_offset",
-            ]
+            # Build the DataFrame column-wise: gathering each field into a
+            # list and constructing from a dict of columns skips the
+            # per-row dict unpacking and dtype inference of
+            # pd.DataFrame(list_of_dicts), and yields the desired column
+            # order directly
+            columns = {
+                col: [row.get(col) for row in df_data]
+                for col in _DESIRED_COLUMNS
+                if col in df_data[0]
+            }
+
+            # Ensure date column is datetime; the API always returns
+            # YYYY-MM-DD, so an explicit format avoids per-value inference
+            if "date" in columns:
+                columns["date"] = pd.to_datetime(
+                    columns["date"], format="%Y-%m-%d", cache=True
+                )
+
+            df = pd.DataFrame(columns)
 
-            # Only include columns that exist in the response
-            available_columns = [col for col in desired_columns if col in df.columns]
-            df = df[available_columns]
+            # Precompute numeric day length with one vectorized split:
+            # day_length is always H:MM:SS regardless of time_format, and
+            # integer arithmetic on the split parts skips pandas' general
+            # timedelta parser entirely
+            if "day_length" in df.columns:
+                hms = df["day_length"].str.split(":", expand=True).astype(np.int32)
+                df["day_length_seconds"] = (hms[0] * 3600 + hms[1] * 60 + hms[2]).astype(
+                    np.int32
+                )
 
-            # Save to cache before returning
+            # Save to both caches before returning
             if use_cache:
                 _save_to_cache(cache_key, df)
-
-            # Add a small delay after successful API calls to be respectful to the API
-            # This helps prevent rate limiting, especially important for cloud platforms
-            time.sleep(0.5)
+                _memo_put(cache_key, df)
 
             return df
 
         except requests.exceptions.RequestException as e:
             last_exception = e
+            if "429" in str(e) or "503" in str(e):
+                _signal_throttle()
             if attempt < max_retries:
                 print(
                     f"API request failed (attempt {attempt + 1}/{max_retries + 1}): {str(e)}"
@@ -336,6 +526,7 @@ def get_sunrise_sunset_data(
 
     # If we get here, all retries failed
     if last_exception and "503" in str(last_exception):
+        _api_down_until = time.time() + _API_DOWN_WINDOW_SECONDS
         raise requests.RequestException(
             f"SunriseSunset.io API is temporarily unavailable (503 Service Unavailable) after {max_retries + 1} attempts. "
             f"This commonly happens on cloud platforms like Streamlit Cloud. Please try again later or reduce the date range. "
@@ -463,6 +654,17 @@ def get_sunrise_sunset_data_with_stale_cache_fallback(
     Raises:
         requests.RequestException: If API fails and no cache is available
     """
+    # Compute the cache key up front so the fallback path can reuse it
+    cache_key = _get_cache_key(
+        latitude,
+        longitude,
+        timezone,
+        _to_date_str(date_value),
+        _to_date_str(date_start),
+        _to_date_str(date_end),
+        time_format,
+    )
+
     try:
         # First try normal API call with regular cache
         return get_sunrise_sunset_data(
@@ -482,33 +684,7 @@ def get_sunrise_sunset_data_with_stale_cache_fallback(
         if "503" in str(e) or "Service Unavailable" in str(e):
             print("🔄 API unavailable, checking for stale cache...")
 
-            # Convert dates to strings for cache key
-            date_str = None
-            start_str = None
-            end_str = None
-
-            if date_value is not None:
-                if isinstance(date_value, (date, datetime)):
-                    date_str = date_value.strftime("%Y-%m-%d")
-                else:
-                    date_str = str(date_value)
-
-            if date_start is not None:
-                if isinstance(date_start, (date, datetime)):
-                    start_str = date_start.strftime("%Y-%m-%d")
-                else:
-                    start_str = str(date_start)
-
-            if date_end is not None:
-                if isinstance(date_end, (date, datetime)):
-                    end_str = date_end.strftime("%Y-%m-%d")
-                else:
-                    end_str = str(date_end)
-
-            # Try to load from stale cache
-            cache_key = _get_cache_key(
-                latitude, longitude, timezone, date_str, start_str, end_str, time_format
-            )
+            # Try to load from stale cache with the precomputed key
             stale_data = _load_from_cache(cache_key, stale_cache_max_age_days * 24)
 
             if stale_data is not None:
@@ -530,12 +706,20 @@ def clear_cache() -> int:
         int: Number of cache files removed
     """
     try:
+        _memo_cache.clear()
+
         cache_dir = _get_cache_path()
         removed_count = 0
 
-        for cache_file in cache_dir.glob("*.pkl"):
-            cache_file.unlink()
-            removed_count += 1
+        with os.scandir(cache_dir) as entries:
+            for entry in entries:
+                if entry.name.endswith((".parquet", ".pkl")):
+                    try:
+                        os.unlink(entry.path)
+                        removed_count += 1
+                    except FileNotFoundError:
+                        # Another process already removed it
+                        pass
 
         print(f"🗑️ Cleared {removed_count} cache files")
         return removed_count
@@ -553,7 +737,12 @@ def get_cache_info() -> dict:
     """
     try:
         cache_dir = _get_cache_path()
-        cache_files = list(cache_dir.glob("*.pkl"))
+        with os.scandir(cache_dir) as entries:
+            cache_files = [
+                (entry.name, entry.stat())
+                for entry in entries
+                if entry.name.endswith((".parquet", ".pkl"))
+            ]
 
         if not cache_files:
             return {
@@ -564,33 +753,112 @@ def get_cache_info() -> dict:
                 "newest_file": None,
             }
 
-        total_size = sum(f.stat().st_size for f in cache_files)
-        file_times = [(f, f.stat().st_mtime) for f in cache_files]
-        oldest_file = min(file_times, key=lambda x: x[1])
-        newest_file = max(file_times, key=lambda x: x[1])
+        total_size = sum(st.st_size for _, st in cache_files)
+        oldest_file = min(cache_files, key=lambda x: x[1].st_mtime)
+        newest_file = max(cache_files, key=lambda x: x[1].st_mtime)
 
         return {
             "file_count": len(cache_files),
             "total_size_mb": round(total_size / (1024 * 1024), 2),
             "cache_dir": str(cache_dir),
             "oldest_file": {
-                "name": oldest_file[0].name,
-                "age_hours": round((time.time() - oldest_file[1]) / 3600, 1),
+                "name": oldest_file[0],
+                "age_hours": round((time.time() - oldest_file[1].st_mtime) / 3600, 1),
             },
             "newest_file": {
-                "name": newest_file[0].name,
-                "age_hours": round((time.time() - newest_file[1]) / 3600, 1),
+                "name": newest_file[0],
+                "age_hours": round((time.time() - newest_file[1].st_mtime) / 3600, 1),
             },
         }
     except Exception as e:
         return {"error": str(e)}
 
 
+def _format_decimal_hours(values: np.ndarray) -> list:
+    """Format an array of decimal hours as HH:MM:SS strings; NaN becomes None."""
+    nan_mask = np.isnan(values)
+
+    total_seconds = np.rint(np.where(nan_mask, 0.0, values) * 3600).astype(np.int64)
+    total_seconds %= 86400
+    hours, remainder = np.divmod(total_seconds, 3600)
+    minutes, seconds = np.divmod(remainder, 60)
+
+    return [
+        None if invalid else f"{h:02d}:{m:02d}:{s:02d}"
+        for invalid, h, m, s in zip(nan_mask, hours, minutes, seconds)
+    ]
+
+
+def _offline_year_dataframe(
+    latitude: float,
+    longitude: float,
+    year: int,
+    timezone: str,
+) -> pd.DataFrame:
+    """
+    Build a year of sunrise/sunset data locally in the API column schema.
+
+    Runs the vectorized NOAA model from noaa_solar_calculations instead of
+    calling the API, mapping its twilight columns onto the API names
+    (official -> sunrise/sunset, civil -> dawn/dusk, astronomical ->
+    first_light/last_light). The timezone's UTC offset is sampled once at
+    January 1st of the year, so DST transitions within the year are not
+    modeled on this path. Polar day/night rows come out as None times.
+    """
+    import pytz
+
+    from .noaa_solar_calculations import yearly_sun_times_dataframe
+
+    if timezone is None:
+        raise ValueError("offline=True requires an explicit timezone name")
+
+    offset_hours = (
+        pytz.timezone(timezone).utcoffset(datetime(year, 1, 1)).total_seconds() / 3600.0
+    )
+
+    df_local = yearly_sun_times_dataframe(latitude, longitude, offset_hours, year=year)
+
+    day_length_hours = (
+        df_local["official_sunset"].to_numpy()
+        - df_local["official_sunrise"].to_numpy()
+    )
+    nan_mask = np.isnan(day_length_hours)
+    day_length_seconds = np.rint(np.where(nan_mask, 0.0, day_length_hours) * 3600)
+    dl_hours, remainder = np.divmod(day_length_seconds.astype(np.int64), 3600)
+    dl_minutes, dl_seconds = np.divmod(remainder, 60)
+
+    return pd.DataFrame(
+        {
+            "date": df_local["date"],
+            "sunrise": _format_decimal_hours(df_local["official_sunrise"].to_numpy()),
+            "sunset": _format_decimal_hours(df_local["official_sunset"].to_numpy()),
+            "first_light": _format_decimal_hours(
+                df_local["astronomical_sunrise"].to_numpy()
+            ),
+            "last_light": _format_decimal_hours(
+                df_local["astronomical_sunset"].to_numpy()
+            ),
+            "dawn": _format_decimal_hours(df_local["civil_sunrise"].to_numpy()),
+            "dusk": _format_decimal_hours(df_local["civil_sunset"].to_numpy()),
+            "solar_noon": _format_decimal_hours(df_local["solar_noon"].to_numpy()),
+            "day_length": [
+                None if invalid else f"{h}:{m:02d}:{s:02d}"
+                for invalid, h, m, s in zip(nan_mask, dl_hours, dl_minutes, dl_seconds)
+            ],
+            "timezone": timezone,
+            "utc_offset": int(offset_hours * 60),
+            "day_length_seconds": day_length_seconds.astype(np.int32),
+        }
+    )
+
+
 def get_sunrise_sunset_year(
     latitude: float,
     longitude: float,
     year: int,
     timezone: Optional[str] = None,
+    offline: bool = False,
+    derive: bool = False,
 ) -> pd.DataFrame:
     """
     Get sunrise and sunset times for an entire year.
@@ -598,11 +866,23 @@ def get_sunrise_sunset_year(
     This function automatically handles leap years and fetches data in chunks
     to respect API limits (maximum 365 days per request).
 
+    Results are memoized in-process per (rounded lat/lng, year, timezone),
+    so repeated calls with the same location skip the HTTP fetches entirely;
+    coordinates are rounded to 4 decimals (~10 m) to raise the hit rate.
+
     Args:
         latitude (float): Latitude of the location in decimal degrees
         longitude (float): Longitude of the location in decimal degrees
         year (int): The year to get data for (e.g., 2024)
         timezone (str, optional): Timezone of the returned times
+        offline (bool): Compute the data locally with the NOAA solar model
+                        instead of calling the API. Requires an explicit
+                        timezone name; DST transitions within the year are
+                        not modeled on this path.
+        derive (bool): Also compute the derived day_length_seconds,
+                       day_of_year and season columns. Off by default so
+                       callers that only want the raw times skip the extra
+                       columnar allocations.
 
     Returns:
         pd.DataFrame: DataFrame containing sunrise/sunset data for the entire year
@@ -617,8 +897,23 @@ def get_sunrise_sunset_year(
         >>> print(f"Longest day: {longest_day['date'].strftime('%Y-%m-%d')} ({longest_day['day_length']})")
         >>> print(f"Shortest day: {shortest_day['date'].strftime('%Y-%m-%d')} ({shortest_day['day_length']})")
     """
-    from calendar import isleap
+    # Return a copy so callers can mutate their frame without corrupting
+    # the cached one
+    return _get_sunrise_sunset_year_cached(
+        round(latitude, 4), round(longitude, 4), year, timezone, offline, derive
+    ).copy()
 
+
+@lru_cache(maxsize=64)
+def _get_sunrise_sunset_year_cached(
+    latitude: float,
+    longitude: float,
+    year: int,
+    timezone: Optional[str],
+    offline: bool = False,
+    derive: bool = False,
+) -> pd.DataFrame:
+    """Uncached implementation behind get_sunrise_sunset_year."""
     # Determine if it's a leap year
     is_leap = isleap(year)
 
@@ -626,26 +921,40 @@ def get_sunrise_sunset_year(
     start_date = date(year, 1, 1)
     end_date = date(year, 12, 31)
 
+    if offline:
+        # Compute locally, skipping the API entirely
+        df_year = _offline_year_dataframe(latitude, longitude, year, timezone)
+
     # Check if it's a leap year and we need to split the request
-    if is_leap:
+    elif is_leap:
         # For leap years (366 days), we need to split into two requests
-        # since API limit is 365 days per request
-
-        # First request: Jan 1 to Dec 30 (364 days)
-        mid_date = date(year, 12, 30)
-
-        df1 = get_sunrise_sunset_data(
-            latitude,
-            longitude,
-            timezone=timezone,
-            date_start=start_date,
-            date_end=mid_date,
-        )
-
-        # Second request: Dec 31 (1 day)
-        df2 = get_sunrise_sunset_data(
-            latitude, longitude, timezone=timezone, date_value=end_date
-        )
+        # since API limit is 365 days per request. Split near the middle
+        # (Jan 1 - Jun 30 and Jul 1 - Dec 31) so both halves are ordinary
+        # range queries, rather than a 364-day request plus an extra
+        # round-trip for a single trailing day
+        mid_date = date(year, 6, 30)
+
+        # The two halves are independent network requests; fetching them
+        # concurrently overlaps the round-trips
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            first_half = executor.submit(
+                get_sunrise_sunset_data,
+                latitude,
+                longitude,
+                timezone=timezone,
+                date_start=start_date,
+                date_end=mid_date,
+            )
+            second_half = executor.submit(
+                get_sunrise_sunset_data,
+                latitude,
+                longitude,
+                timezone=timezone,
+                date_start=date(year, 7, 1),
+                date_end=end_date,
+            )
+            df1 = first_half.result()
+            df2 = second_half.result()
 
         # Combine the dataframes
         df_year = pd.concat([df1, df2], ignore_index=True)
@@ -660,74 +969,131 @@ def get_sunrise_sunset_year(
             date_end=end_date,
         )
 
-    # Sort by date to ensure proper order
-    df_year = df_year.sort_values("date").reset_index(drop=True)
-
-    # Add some useful derived columns
-    if "day_length" in df_year.columns:
-        # Convert day_length to seconds for easier analysis
-        df_year["day_length_seconds"] = pd.to_timedelta(
-            df_year["day_length"]
-        ).dt.total_seconds()
-
-        # Add day of year
-        df_year["day_of_year"] = df_year["date"].dt.dayofyear
-
-        # Add season information (Northern Hemisphere by default)
-        def get_season(month, day, latitude):
-            """Determine season based on date and hemisphere."""
-            # Northern hemisphere seasons
-            if latitude >= 0:
-                if (
-                    (month == 12 and day >= 21)
-                    or month in [1, 2]
-                    or (month == 3 and day < 20)
-                ):
-                    return "Winter"
-                elif (
-                    (month == 3 and day >= 20)
-                    or month in [4, 5]
-                    or (month == 6 and day < 21)
-                ):
-                    return "Spring"
-                elif (
-                    (month == 6 and day >= 21)
-                    or month in [7, 8]
-                    or (month == 9 and day < 22)
-                ):
-                    return "Summer"
-                else:
-                    return "Autumn"
-            # Southern hemisphere seasons (opposite)
-            else:
-                if (
-                    (month == 12 and day >= 21)
-                    or month in [1, 2]
-                    or (month == 3 and day < 20)
-                ):
-                    return "Summer"
-                elif (
-                    (month == 3 and day >= 20)
-                    or month in [4, 5]
-                    or (month == 6 and day < 21)
-                ):
-                    return "Autumn"
-                elif (
-                    (month == 6 and day >= 21)
-                    or month in [7, 8]
-                    or (month == 9 and day < 22)
-                ):
-                    return "Winter"
-                else:
-                    return "Spring"
+    # Sort by date to ensure proper order; the API returns chronological
+    # data, so the monotonicity check usually skips the sort outright
+    if not df_year["date"].is_monotonic_increasing:
+        df_year = df_year.sort_values("date", kind="mergesort")
+    df_year = df_year.reset_index(drop=True)
+
+    # Add the derived columns only when asked for
+    if derive and "day_length" in df_year.columns:
+        # day_length_seconds is computed at fetch time; fall back to the
+        # timedelta parser only for frames cached on disk before that
+        if "day_length_seconds" not in df_year.columns:
+            # int32 matches the fetch-time column and halves the bytes
+            # scanned by idxmax/idxmin over the year
+            df_year["day_length_seconds"] = (
+                pd.to_timedelta(df_year["day_length"])
+                .dt.total_seconds()
+                .astype(np.int32)
+            )
 
-        df_year["season"] = df_year.apply(
-            lambda row: get_season(row["date"].month, row["date"].day, latitude), axis=1
-        )
+        # Add day of year; values fit comfortably in int16
+        df_year["day_of_year"] = df_year["date"].dt.dayofyear.astype(np.int16)
+
+        # Season classification via the precomputed lookup table: one
+        # vectorized gather instead of evaluating boundary masks per call
+        month = df_year["date"].dt.month.to_numpy()
+        day = df_year["date"].dt.day.to_numpy()
+        codes = _SEASON_TABLE[(month << 5) + day]
+
+        # Northern hemisphere labels; the southern hemisphere is opposite
+        if latitude >= 0:
+            labels = ["Winter", "Spring", "Summer", "Autumn"]
+        else:
+            labels = ["Summer", "Autumn", "Winter", "Spring"]
+
+        df_year["season"] = pd.Categorical.from_codes(codes, categories=labels)
 
     return df_year
 
 
+def get_sunrise_sunset_year_bulk(
+    latitudes,
+    longitudes,
+    year: int,
+    timezone_offset: Union[float, list, np.ndarray] = 0.0,
+) -> pd.DataFrame:
+    """
+    Compute a year of sunrise/sunset times for many locations in one pass.
+
+    Unlike get_sunrise_sunset_year this never touches the API: the whole
+    (location, day) grid is evaluated by the solar kernel from
+    noaa_solar_calculations_numba (compiled and parallelized when numba is
+    installed, pure Python otherwise). Intended for comparing many cities
+    at once, where per-location API calls would dominate the runtime.
+
+    Args:
+        latitudes: Array-like of latitudes in decimal degrees
+        longitudes: Array-like of longitudes in decimal degrees, same length
+        year (int): The year to compute data for (e.g., 2024)
+        timezone_offset: UTC offset in hours, either a single value applied
+                         to all locations or one value per location
+
+    Returns:
+        pd.DataFrame: Long-format DataFrame with one row per (location, day)
+                      and columns:
+                      - location: Index of the location in the input arrays
+                      - latitude, longitude: Coordinates of the location
+                      - date: Date of the data
+                      - sunrise, solar_noon, sunset: Local decimal hours at
+                        the official solar elevation (-0.833 degrees)
+
+    Example:
+        >>> df = get_sunrise_sunset_year_bulk(
+        ...     [40.7128, -34.6118], [-74.0060, -58.3960], 2024,
+        ...     timezone_offset=[-5, -3],
+        ... )
+        >>> print(f"Got {len(df)} rows for 2 locations")
+    """
+    from .noaa_solar_calculations_numba import solar_times_grid
+
+    lats = np.ascontiguousarray(latitudes, dtype=np.float64)
+    lngs = np.ascontiguousarray(longitudes, dtype=np.float64)
+    if lats.shape != lngs.shape:
+        raise ValueError("latitudes and longitudes must have the same length")
+
+    offsets = np.ascontiguousarray(
+        np.broadcast_to(np.asarray(timezone_offset, dtype=np.float64), lats.shape)
+    )
+
+    # Julian days for every date of the year at 12:00 UTC; the kernel
+    # applies each location's offset as a continuous JD shift
+    dates = pd.date_range(f"{year}-01-01", f"{year}-12-31", freq="D")
+    julian_days = dates.to_julian_date().to_numpy() + 0.5
+
+    sunrise, noon, sunset = solar_times_grid(julian_days, lats, lngs, offsets)
+
+    n_locations = len(lats)
+    n_days = len(dates)
+
+    return pd.DataFrame(
+        {
+            "location": np.repeat(np.arange(n_locations), n_days),
+            "latitude": np.repeat(lats, n_days),
+            "longitude": np.repeat(lngs, n_days),
+            "date": np.tile(dates.to_numpy(), n_locations),
+            "sunrise": sunrise.ravel(),
+            "solar_noon": noon.ravel(),
+            "sunset": sunset.ravel(),
+        }
+    )
+
+
+def _coerce_date(value: Union[str, date, datetime], year: int) -> date:
+    """Coerce a str/date/datetime switch date to a date in the given year.
+
+    Strings go through date.fromisoformat, a C builtin several times
+    faster than strptime's format-string interpreter.
+    """
+    if type(value) is str:
+        value = date.fromisoformat(value)
+    elif type(value) is datetime:
+        value = value.date()
+
+    return value.replace(year=year)
+
+
 def get_sunrise_sunset_year_dual_timezone(
     latitude: float,
     longitude: float,
@@ -772,73 +1138,71 @@ def get_sunrise_sunset_year_dual_timezone(
         >>> print(df[df['active_timezone'] == winter_timezone].shape[0], "days with winter timezone")
     """
 
-    # Convert date inputs to date objects
-    if isinstance(summer_start_date, str):
-        summer_start = datetime.strptime(summer_start_date, "%Y-%m-%d").date()
-    elif isinstance(summer_start_date, datetime):
-        summer_start = summer_start_date.date()
-    else:
-        summer_start = summer_start_date
-
-    if isinstance(winter_start_date, str):
-        winter_start = datetime.strptime(winter_start_date, "%Y-%m-%d").date()
-    elif isinstance(winter_start_date, datetime):
-        winter_start = winter_start_date.date()
-    else:
-        winter_start = winter_start_date
+    # Convert date inputs to date objects in the requested year
+    summer_start = _coerce_date(summer_start_date, year)
+    winter_start = _coerce_date(winter_start_date, year)
+
+    # With identical timezones the two fetches would return the same data;
+    # do a single fetch and label it
+    if summer_timezone == winter_timezone:
+        df_single = get_sunrise_sunset_year(latitude, longitude, year, summer_timezone)
+        df_single["active_timezone"] = summer_timezone
+        return df_single
+
+    # Fetch only the window each timezone is active for, instead of two
+    # full-year fetches that each discard roughly half their rows. One
+    # timezone covers a contiguous middle window, the other the two
+    # year edges around it; every segment stays within the 365-day API
+    # limit even in leap years
+    jan1 = date(year, 1, 1)
+    dec31 = date(year, 12, 31)
+    one_day = timedelta(days=1)
 
-    # Ensure dates are for the correct year
-    summer_start = summer_start.replace(year=year)
-    winter_start = winter_start.replace(year=year)
-
-    # Fetch complete year data for both timezones
-    df_summer = get_sunrise_sunset_year(latitude, longitude, year, summer_timezone)
-    df_winter = get_sunrise_sunset_year(latitude, longitude, year, winter_timezone)
-
-    # Create a combined dataframe using the appropriate timezone for each date
-    df_combined = df_summer.copy()  # Start with summer data as base
-
-    # Add active_timezone column to track which timezone is being used
-    df_combined["active_timezone"] = summer_timezone
-
-    # Add date_only columns for easier matching
-    df_combined["date_only"] = pd.to_datetime(df_combined["date"]).dt.date
-    df_winter["date_only"] = pd.to_datetime(df_winter["date"]).dt.date
-
-    # Determine which dates should use winter timezone
     if winter_start < summer_start:
         # Winter period: winter_start to summer_start (exclusive)
-        winter_mask = (df_combined["date_only"] >= winter_start) & (
-            df_combined["date_only"] < summer_start
-        )
+        segments = [
+            (jan1, winter_start - one_day, summer_timezone),
+            (winter_start, summer_start - one_day, winter_timezone),
+            (summer_start, dec31, summer_timezone),
+        ]
     else:
         # Winter period: winter_start to end of year AND start of year to summer_start
-        winter_mask = (df_combined["date_only"] >= winter_start) | (
-            df_combined["date_only"] < summer_start
-        )
+        segments = [
+            (jan1, summer_start - one_day, winter_timezone),
+            (summer_start, winter_start - one_day, summer_timezone),
+            (winter_start, dec31, winter_timezone),
+        ]
+
+    # A switch date on January 1st leaves an empty edge window
+    active_segments = [
+        segment for segment in segments if segment[0] <= segment[1]
+    ]
+
+    # The segments are independent network requests; fetch them
+    # concurrently and reassemble in chronological order
+    frames = []
+    with ThreadPoolExecutor(max_workers=len(active_segments)) as executor:
+        futures = [
+            executor.submit(
+                get_sunrise_sunset_data,
+                latitude,
+                longitude,
+                timezone=active_timezone,
+                date_start=segment_start,
+                date_end=segment_end,
+            )
+            for segment_start, segment_end, active_timezone in active_segments
+        ]
+        for (_, _, active_timezone), future in zip(active_segments, futures):
+            df_segment = future.result()
+            df_segment["active_timezone"] = active_timezone
+            frames.append(df_segment)
+
+    df_combined = pd.concat(frames, ignore_index=True)
+
+    # Sort by date to ensure proper order; segments are fetched in
+    # chronological order, so this normally skips the sort
+    if not df_combined["date"].is_monotonic_increasing:
+        df_combined = df_combined.sort_values("date", kind="mergesort")
 
-    # Replace data with winter timezone data for winter period dates
-    winter_indices = df_combined[winter_mask].index
-    if len(winter_indices) > 0:
-        # Update the combined dataframe with winter data
-        for idx in winter_indices:
-            date_val = df_combined.loc[idx, "date_only"]
-            winter_row = df_winter[df_winter["date_only"] == date_val]
-            if not winter_row.empty:
-                # Replace all columns except 'active_timezone' and 'date_only'
-                for col in df_combined.columns:
-                    if (
-                        col not in ["active_timezone", "date_only"]
-                        and col in winter_row.columns
-                    ):
-                        df_combined.loc[idx, col] = winter_row.iloc[0][col]
-                # Set active timezone
-                df_combined.loc[idx, "active_timezone"] = winter_timezone
-
-    # Remove the temporary date_only column
-    df_combined = df_combined.drop("date_only", axis=1)
-
-    # Sort by date to ensure proper order
-    df_combined = df_combined.sort_values("date").reset_index(drop=True)
-
-    return df_combined
+    return df_combined.reset_index(drop=True)
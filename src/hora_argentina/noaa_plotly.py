@@ -2,7 +2,23 @@
 Plotly visualization functions for solar time data.
 """
 
-import plotly.graph_objects as go
+import hashlib
+import math
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+try:
+    from .noaa_solar_calculations_numba import (
+        NUMBA_AVAILABLE as _NUMBA_AVAILABLE,
+        hours_to_hhmm_bytes as _hours_to_hhmm_bytes,
+    )
+except ImportError:
+    _NUMBA_AVAILABLE = False
+
+# Below this many rows the compiled byte kernel is not worth dispatching
+_NUMBA_FORMAT_THRESHOLD = 10_000
 
 # Predefined trace combinations for common use cases
 TRACE_COMBINATIONS = {
@@ -42,34 +58,206 @@ TRACE_COMBINATIONS = {
 }
 
 
+# Hour-axis tick positions and labels, built once for every figure
+_HOUR_TICKVALS = list(range(0, 25, 2))
+_HOUR_TICKTEXT = [f"{h:02d}:00" for h in _HOUR_TICKVALS]
+
+# Trace order and styling shared by every figure
+_TWILIGHT_TYPES = ("official", "civil", "nautical", "astronomical")
+
+_TWILIGHT_COLORS = {
+    "astronomical": "#1f1f1f",  # Very dark gray (darkest twilight)
+    "nautical": "#4a5568",  # Dark gray
+    "civil": "#718096",  # Medium gray
+    "official": "#f56565",  # Red (sun visible)
+}
+
+# Spanish names for twilight types
+_TWILIGHT_NAMES_ES = {
+    "official": "Oficial",
+    "civil": "Civil",
+    "nautical": "Náutico",
+    "astronomical": "Astronómico",
+}
+
+# Trace names and hover templates only depend on the twilight type and
+# event, so build them once at import time instead of per figure
+_TRACE_NAMES = {
+    twilight: {
+        "sunrise": f"Amanecer {name}",
+        "sunset": f"Atardecer {name}",
+    }
+    for twilight, name in _TWILIGHT_NAMES_ES.items()
+}
+
+_HOVER_TEMPLATES = {
+    twilight: {
+        event: f"<b>{_TRACE_NAMES[twilight][event]}</b><br>"
+        + "Hora: %{customdata}<br>"
+        + "<extra></extra>"
+        for event in ("sunrise", "sunset")
+    }
+    for twilight in _TWILIGHT_TYPES
+}
+
+# Full per-column trace scaffolds — everything except the data arrays —
+# assembled once at import time; plot calls just splice in x/y/customdata
+_TRACE_SCAFFOLD = {
+    f"{twilight}_{event}": {
+        "type": "scattergl",
+        "name": _TRACE_NAMES[twilight][event],
+        "line": (
+            {"color": _TWILIGHT_COLORS[twilight]}
+            if event == "sunrise"
+            else {"color": _TWILIGHT_COLORS[twilight], "dash": "dash"}
+        ),
+        "mode": "lines",
+        "legendgroup": twilight,
+        "hovertemplate": _HOVER_TEMPLATES[twilight][event],
+    }
+    for twilight in _TWILIGHT_TYPES
+    for event in ("sunrise", "sunset")
+}
+_TRACE_SCAFFOLD["solar_noon"] = {
+    "type": "scattergl",
+    "name": "Mediodía Solar",
+    # Orange color, thicker line
+    "line": {"color": "#f7931e", "width": 3},
+    "mode": "lines",
+    "legendgroup": "solar_noon",
+    "hovertemplate": "<b>Mediodía Solar</b><br>"
+    + "Hora: %{customdata}<br>"
+    + "<extra></extra>",
+}
+
+# Frozen membership sets for the predefined combinations, so selecting a
+# preset skips rebuilding a set on every call
+_TRACE_COMBINATION_SETS = {
+    name: frozenset(columns) for name, columns in TRACE_COMBINATIONS.items()
+}
+
+# Widget-driven reruns rebuild identical figures over and over; keep the
+# assembled trace/layout dicts for recent (data, options) combinations.
+# Frames beyond the row limit skip the cache since hashing them would
+# cost more than the rebuild saves.
+_FIGURE_CACHE_MAXSIZE = 32
+_FIGURE_CACHE_ROW_LIMIT = 10_000
+_figure_cache = OrderedDict()
+
+
+def clear_figure_cache():
+    """Drop all cached figure components."""
+    _figure_cache.clear()
+
+
 def decimal_hours_to_time_string(decimal_hours):
     """Convert decimal hours to HH:MM format, rounded to the closest minute."""
-    import math
-
     if decimal_hours is None or math.isnan(decimal_hours):
         return "N/A"
 
-    # Handle negative hours (wrap around midnight)
-    while decimal_hours < 0:
-        decimal_hours += 24
-    while decimal_hours >= 24:
-        decimal_hours -= 24
+    # A single modulo wraps negative and >= 24h values (no while loops);
+    # the second wrap catches rounding just below midnight landing on 24:00
+    total_minutes = round((decimal_hours % 24.0) * 60) % (24 * 60)
+    hours, minutes = divmod(total_minutes, 60)
 
-    # Convert to total minutes and round to nearest minute
-    total_minutes = round(decimal_hours * 60)
+    return f"{hours:02d}:{minutes:02d}"
 
-    # Handle edge case where rounding could give us 24:00
-    if total_minutes >= 24 * 60:
-        total_minutes = 0
 
-    hours = total_minutes // 60
-    minutes = total_minutes % 60
+def decimal_hours_to_time_strings(values):
+    """Convert an array of decimal hours to HH:MM strings in one pass.
 
-    return f"{hours:02d}:{minutes:02d}"
+    Vectorized counterpart of decimal_hours_to_time_string: the wrap and
+    divmod arithmetic runs over the whole array at once, leaving only the
+    final string formatting in Python. NaN entries come out as "N/A".
+    """
+    values = np.asarray(values, dtype=np.float64)
+    nan_mask = np.isnan(values)
+
+    # Very large inputs (multi-decade or sub-daily frames) go through
+    # the compiled byte kernel when numba is available: it writes the
+    # "HH:MM" records into one uint8 buffer that is viewed as strings
+    # in a single shot, skipping the per-element Python formatting
+    if _NUMBA_AVAILABLE and values.shape[0] >= _NUMBA_FORMAT_THRESHOLD:
+        buffer = np.empty((values.shape[0], 5), dtype=np.uint8)
+        _hours_to_hhmm_bytes(values, buffer)
+        strings = buffer.view("S5").ravel().astype("U5")
+        return np.where(nan_mask, "N/A", strings).tolist()
+
+    total_minutes = np.rint(
+        np.mod(np.where(nan_mask, 0.0, values), 24.0) * 60
+    ).astype(np.int32)
+    # Rounding just below midnight can land on 24:00; wrap it to 00:00
+    total_minutes %= 24 * 60
+    hours, minutes = np.divmod(total_minutes, 60)
+
+    return [
+        "N/A" if invalid else f"{h:02d}:{m:02d}"
+        for invalid, h, m in zip(nan_mask, hours, minutes)
+    ]
+
+
+# All time columns a frame may carry, in trace order
+_TIME_COLUMNS = tuple(
+    f"{twilight}_{event}"
+    for twilight in _TWILIGHT_TYPES
+    for event in ("sunrise", "sunset")
+) + ("solar_noon",)
+
+# Selection meaning "every trace", used when the caller passes None
+_ALL_TRACES = frozenset(_TIME_COLUMNS)
+
+
+def ensure_time_strings(df):
+    """Return a frame carrying a "{col}_str" label column per time column.
+
+    Columns that already have their string counterpart are left alone, so
+    a frame run through this once (or passed between plot calls) skips the
+    formatting entirely. Missing columns are attached with a single concat
+    instead of per-column inserts to avoid block fragmentation.
+    """
+    missing = [
+        col
+        for col in _TIME_COLUMNS
+        if col in df.columns and f"{col}_str" not in df.columns
+    ]
+    if not missing:
+        return df
+
+    new_columns = {
+        f"{col}_str": decimal_hours_to_time_strings(df[col]) for col in missing
+    }
+    return pd.concat([df, pd.DataFrame(new_columns, index=df.index)], axis=1)
+
+
+def _m4_indices(values, max_bins):
+    """Row indices kept by M4 downsampling of a numeric column.
+
+    Each of `max_bins` equal slices keeps its first, minimum, maximum
+    and last point, which reproduces the drawn line exactly at the
+    target pixel width while capping the trace at 4 * max_bins points.
+    """
+    n = values.shape[0]
+    edges = np.linspace(0, n, max_bins + 1).astype(np.intp)
+    keep = np.empty(4 * max_bins, dtype=np.intp)
+    pos = 0
+    for b in range(max_bins):
+        start = edges[b]
+        stop = edges[b + 1]
+        if stop <= start:
+            continue
+        window = values[start:stop]
+        keep[pos] = start
+        keep[pos + 1] = start + np.argmin(window)
+        keep[pos + 2] = start + np.argmax(window)
+        keep[pos + 3] = stop - 1
+        pos += 4
+
+    # unique also sorts, restoring chronological order within the keeps
+    return np.unique(keep[:pos])
 
 
 def plot_yearly_sun_times(
-    df, title=None, subtitle=None, show_figure=False, traces=None
+    df, title=None, subtitle=None, show_figure=False, traces=None, max_pixels=1200
 ):
     """
     Plot sunrise and sunset times for all twilight definitions throughout the year.
@@ -114,6 +302,12 @@ def plot_yearly_sun_times(
         - 'astronomical_twilight': astronomical twilight times
 
         If None, includes all available traces.
+    max_pixels : int, optional
+        Target horizontal resolution for downsampling (default: 1200).
+        Frames much longer than this (e.g. multi-year or sub-daily data)
+        are reduced per column with M4 aggregation, which keeps the first,
+        minimum, maximum and last point of each pixel-wide bin. Pass None
+        to disable downsampling.
 
     Returns:
     --------
@@ -130,160 +324,143 @@ def plot_yearly_sun_times(
     >>> # Or use custom list
     >>> fig = plot_yearly_sun_times(df, traces=['official_sunrise', 'official_sunset', 'solar_noon'])
     """
-
-    # Create figure
-    fig = go.Figure()
-
-    # Define colors for different twilight types
-    colors = {
-        "astronomical": "#1f1f1f",  # Very dark gray (darkest twilight)
-        "nautical": "#4a5568",  # Dark gray
-        "civil": "#718096",  # Medium gray
-        "official": "#f56565",  # Red (sun visible)
-    }
-
-    # Spanish names for twilight types
-    twilight_names_es = {
-        "official": "Oficial",
-        "civil": "Civil",
-        "nautical": "Náutico",
-        "astronomical": "Astronómico",
-    }
-
-    # Determine which traces to include
+    # Deferred so importing this module (e.g. for the formatting
+    # helpers) does not pay plotly's heavy schema/validator load; the
+    # traces and layout are plain dicts, so only the final go.Figure
+    # construction needs it
+    import plotly.graph_objects as go
+
+    # Normalize the trace selection to a single frozenset up front; the
+    # rest of the function is one loop over the selected columns
     if traces is None:
         # Include all available traces
-        include_all_traces = True
-    else:
+        selected = _ALL_TRACES
+    elif isinstance(traces, str):
         # Check if traces is a predefined combination name
-        if isinstance(traces, str) and traces in TRACE_COMBINATIONS:
-            traces = TRACE_COMBINATIONS[traces]
-        elif isinstance(traces, str):
+        if traces not in _TRACE_COMBINATION_SETS:
             raise ValueError(
                 f"Unknown predefined trace combination: '{traces}'. "
                 f"Available combinations: {list(TRACE_COMBINATIONS.keys())}"
             )
-
+        selected = _TRACE_COMBINATION_SETS[traces]
+    else:
         # Filter traces based on user specification
-        include_all_traces = False
-        traces_set = set(traces)
-
-    # Add traces for each twilight type, grouping sunrise and sunset together
-    twilight_types = ["official", "civil", "nautical", "astronomical"]
-
-    for twilight in twilight_types:
-        sunrise_col = f"{twilight}_sunrise"
-        sunset_col = f"{twilight}_sunset"
-
-        # Check if we should include this twilight type's traces
-        include_sunrise = include_all_traces or sunrise_col in traces_set
-        include_sunset = include_all_traces or sunset_col in traces_set
-
-        if sunrise_col in df.columns and include_sunrise:
-            # Prepare formatted time strings
-            sunrise_times_formatted = [
-                decimal_hours_to_time_string(time) for time in df[sunrise_col]
-            ]
-
-            # Add sunrise trace
-            fig.add_trace(
-                go.Scatter(
-                    x=df["date"],
-                    y=df[sunrise_col],
-                    name=f"Amanecer {twilight_names_es[twilight]}",
-                    line=dict(color=colors[twilight]),
-                    mode="lines",
-                    legendgroup=twilight,
-                    customdata=sunrise_times_formatted,
-                    hovertemplate=f"<b>Amanecer {twilight_names_es[twilight]}</b><br>"
-                    + "Hora: %{customdata}<br>"
-                    + "<extra></extra>",
-                )
-            )
-
-        if sunset_col in df.columns and include_sunset:
-            # Prepare formatted time strings
-            sunset_times_formatted = [
-                decimal_hours_to_time_string(time) for time in df[sunset_col]
-            ]
-
-            # Add sunset trace
-            fig.add_trace(
-                go.Scatter(
-                    x=df["date"],
-                    y=df[sunset_col],
-                    name=f"Atardecer {twilight_names_es[twilight]}",
-                    line=dict(color=colors[twilight], dash="dash"),
-                    mode="lines",
-                    legendgroup=twilight,
-                    customdata=sunset_times_formatted,
-                    hovertemplate=f"<b>Atardecer {twilight_names_es[twilight]}</b><br>"
-                    + "Hora: %{customdata}<br>"
-                    + "<extra></extra>",
-                )
-            )
-
-    # Add solar noon trace if available and requested
-    include_solar_noon = include_all_traces or (
-        traces is not None and "solar_noon" in traces_set
-    )
-    if "solar_noon" in df.columns and include_solar_noon:
-        solar_noon_times_formatted = [
-            decimal_hours_to_time_string(time) for time in df["solar_noon"]
+        selected = frozenset(traces)
+
+    # Key recent figures on the content of the columns actually drawn
+    # plus the options that shape the output; a hit skips formatting,
+    # downsampling and trace assembly entirely
+    cache_key = None
+    if len(df) <= _FIGURE_CACHE_ROW_LIMIT:
+        digest = hashlib.blake2b(digest_size=16)
+        hashed_columns = ["date"] + [
+            col for col in _TIME_COLUMNS if col in df.columns and col in selected
         ]
+        try:
+            for col in hashed_columns:
+                digest.update(df[col].to_numpy().tobytes())
+        except (TypeError, ValueError):
+            # Unhashable column contents; build this figure uncached
+            pass
+        else:
+            cache_key = (digest.digest(), title, subtitle, max_pixels)
+            cached = _figure_cache.get(cache_key)
+            if cached is not None:
+                _figure_cache.move_to_end(cache_key)
+                cached_traces, cached_layout = cached
+                fig = go.Figure(data=cached_traces, layout=cached_layout)
+                if show_figure:
+                    fig.show()
+                return fig
 
-        fig.add_trace(
-            go.Scatter(
-                x=df["date"],
-                y=df["solar_noon"],
-                name="Mediodía Solar",
-                line=dict(color="#f7931e", width=3),  # Orange color, thicker line
-                mode="lines",
-                legendgroup="solar_noon",
-                customdata=solar_noon_times_formatted,
-                hovertemplate="<b>Mediodía Solar</b><br>"
-                + "Hora: %{customdata}<br>"
-                + "<extra></extra>",
-            )
-        )
+    # Add traces for each twilight type, grouping sunrise and sunset together
 
-    # Customize layout
+    # Attach (or reuse) the precomputed hover-label columns, then pick
+    # out the arrays for the included traces; the dict doubles as the
+    # inclusion test below
+    df = ensure_time_strings(df)
+    formatted_times = {
+        col: df[f"{col}_str"].to_numpy()
+        for col in _TIME_COLUMNS
+        if col in df.columns and col in selected
+    }
 
-    fig.update_layout(
-        # title=dict(text=title, x=0.5, font=dict(size=18)),
-        title=dict(text=title, subtitle=dict(text=subtitle)),
-        xaxis=dict(title="Fecha", tickangle=45),
-        yaxis=dict(
-            title="Hora (horas)", tickmode="linear", tick0=0, dtick=2, range=[0, 24]
-        ),
-        legend=dict(
-            orientation="h",
-            yanchor="bottom",
-            y=-0.6,
-            xanchor="right",
-            x=1.0,
-            # bgcolor="rgba(255, 255, 255, 0.8)",
-            # bordercolor="rgba(0, 0, 0, 0.2)",
-            # borderwidth=1,
-        ),
-        hovermode="x unified",
-        # template="plotly_white",
-        # width=1000,
-        height=450,
-        margin=dict(b=0),  # Extra margin for legend
-        xaxis_fixedrange=True,
-        yaxis_fixedrange=True,
-        dragmode=False,
-    )
+    # Every trace shares the same dates; extract the array once so the
+    # figure holds one x buffer instead of one per trace
+    x_dates = df["date"].to_numpy()
+
+    # For frames well beyond the plot's pixel width, M4-downsample each
+    # column before it reaches the browser; a 4-points-per-bin keep is
+    # only a reduction once the frame exceeds 4 * max_pixels rows
+    trace_arrays = {}
+    for col, labels in formatted_times.items():
+        y_values = df[col].to_numpy()
+        if max_pixels is not None and y_values.shape[0] > 4 * max_pixels:
+            kept = _m4_indices(y_values, max_pixels)
+            trace_arrays[col] = (x_dates[kept], y_values[kept], labels[kept])
+        else:
+            trace_arrays[col] = (x_dates, y_values, labels)
+
+    # Each trace is its import-time scaffold plus the data arrays;
+    # trace_arrays follows _TIME_COLUMNS order, which keeps the original
+    # sunrise/sunset-per-twilight-then-noon legend ordering
+    figure_traces = [
+        {**_TRACE_SCAFFOLD[col], "x": x_values, "y": y_values, "customdata": labels}
+        for col, (x_values, y_values, labels) in trace_arrays.items()
+    ]
+
+    # Single layout dict handed to the constructor alongside the traces;
+    # the y axis carries the HH:MM tick labels directly instead of a
+    # second update_layout pass patching them in afterwards
+    layout = {
+        # "title": {"text": title, "x": 0.5, "font": {"size": 18}},
+        "title": {"text": title, "subtitle": {"text": subtitle}},
+        "xaxis": {"title": "Fecha", "tickangle": 45, "fixedrange": True},
+        "yaxis": {
+            "title": "Hora (horas)",
+            "range": [0, 24],
+            "tickmode": "array",
+            "tickvals": _HOUR_TICKVALS,
+            "ticktext": _HOUR_TICKTEXT,
+            "fixedrange": True,
+        },
+        "legend": {
+            "orientation": "h",
+            "yanchor": "bottom",
+            "y": -0.6,
+            "xanchor": "right",
+            "x": 1.0,
+            # "bgcolor": "rgba(255, 255, 255, 0.8)",
+            # "bordercolor": "rgba(0, 0, 0, 0.2)",
+            # "borderwidth": 1,
+        },
+        "hovermode": "x unified",
+        # "template": "plotly_white",
+        # "width": 1000,
+        "height": 450,
+        "margin": {"b": 0},  # Extra margin for legend
+        "dragmode": False,
+    }
 
-    # Add secondary y-axis with time labels
-    fig.update_layout(
-        yaxis=dict(
-            tickmode="array",
-            tickvals=list(range(0, 25, 2)),
-            ticktext=[f"{h:02d}:00" for h in range(0, 25, 2)],
+    fig = go.Figure(data=figure_traces, layout=layout)
+
+    if cache_key is not None:
+        # Store copies of the data arrays so an in-place mutation of the
+        # caller's frame cannot corrupt a cached figure
+        _figure_cache[cache_key] = (
+            [
+                {
+                    **trace,
+                    "x": np.array(trace["x"]),
+                    "y": np.array(trace["y"]),
+                    "customdata": np.array(trace["customdata"]),
+                }
+                for trace in figure_traces
+            ],
+            layout,
         )
-    )
+        if len(_figure_cache) > _FIGURE_CACHE_MAXSIZE:
+            _figure_cache.popitem(last=False)
 
     if show_figure:
         fig.show()
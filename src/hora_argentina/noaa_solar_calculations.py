@@ -1,7 +1,20 @@
 from datetime import date, datetime, timedelta
-from math import acos, asin, cos, degrees, radians, sin, tan
 
-import pandas as pd
+import numpy as np
+
+# Twilight definitions (solar elevation angles in degrees)
+_TWILIGHT_ANGLES = {
+    "official": -0.833,  # Sun's center at horizon, accounting for refraction
+    "civil": -6.0,  # Civil twilight
+    "nautical": -12.0,  # Nautical twilight
+    "astronomical": -18.0,  # Astronomical twilight
+}
+
+# sin of each twilight elevation, precomputed as a column vector so the
+# yearly builder can broadcast all four angles against the day axis
+_TWILIGHT_SIN_ELEVATIONS = np.sin(
+    np.deg2rad(np.array(list(_TWILIGHT_ANGLES.values())))
+)[:, np.newaxis]
 
 
 def julian_century(julian_day):
@@ -28,10 +41,10 @@ def eccent_earth_orbit(julian_century):
 def sun_eq_of_center(julian_century):
     """Calculate the Sun's Equation of Center (in degrees)."""
     m = geom_mean_anom_sun(julian_century)
-    m_rad = radians(m)
-    sin_m = sin(m_rad)
-    sin_2m = sin(2 * m_rad)
-    sin_3m = sin(3 * m_rad)
+    m_rad = np.deg2rad(m)
+    sin_m = np.sin(m_rad)
+    sin_2m = np.sin(2 * m_rad)
+    sin_3m = np.sin(3 * m_rad)
 
     return (
         sin_m * (1.914602 - julian_century * (0.004817 + 0.000014 * julian_century))
@@ -51,7 +64,7 @@ def sun_apparent_long(julian_century):
     """Calculate the Sun's Apparent Longitude (in degrees)."""
     stl = sun_true_long(julian_century)
     omega = 125.04 - 1934.136 * julian_century
-    return stl - 0.00569 - 0.00478 * sin(radians(omega))
+    return stl - 0.00569 - 0.00478 * np.sin(np.deg2rad(omega))
 
 
 def mean_obliq_ecliptic(julian_century):
@@ -66,21 +79,35 @@ def obliq_corr(julian_century):
     """Calculate the corrected Obliquity of the Ecliptic (in degrees)."""
     e0 = mean_obliq_ecliptic(julian_century)
     omega = 125.04 - 1934.136 * julian_century
-    return e0 + 0.00256 * cos(radians(omega))
+    return e0 + 0.00256 * np.cos(np.deg2rad(omega))
 
 
 def var_y(julian_century):
     """Calculate the variable Y used in the Equation of Time calculation."""
     e = obliq_corr(julian_century)
-    return tan(radians(e) / 2.0) ** 2
+    return np.tan(np.deg2rad(e) / 2.0) ** 2
 
 
-def sun_declination(julian_century):
-    """Calculate the Sun's Declination (in degrees)."""
+def _sun_decl_sincos(julian_century):
+    """Sine and cosine of the Sun's declination, without the arcsin.
+
+    Callers like hour_angle only need sin/cos of the declination, so
+    deriving the pair straight from sin(declination) skips the
+    arcsin/deg2rad round-trip of going through degrees. The declination
+    never exceeds the obliquity (~23.44 degrees), so its cosine is
+    always the positive root.
+    """
     e = obliq_corr(julian_century)
     lambda_sun = sun_apparent_long(julian_century)
-    sint = sin(radians(e)) * sin(radians(lambda_sun))
-    return degrees(asin(sint))
+    sin_d = np.sin(np.deg2rad(e)) * np.sin(np.deg2rad(lambda_sun))
+    cos_d = np.sqrt(1.0 - sin_d * sin_d)
+    return sin_d, cos_d
+
+
+def sun_declination(julian_century):
+    """Calculate the Sun's Declination (in degrees)."""
+    sin_d, _ = _sun_decl_sincos(julian_century)
+    return np.degrees(np.arcsin(sin_d))
 
 
 def equation_of_time(julian_century):
@@ -90,11 +117,16 @@ def equation_of_time(julian_century):
     e = eccent_earth_orbit(julian_century)
     M = geom_mean_anom_sun(julian_century)
 
-    sin_2L0 = sin(2.0 * radians(L0))
-    sin_M = sin(radians(M))
-    cos_2L0 = cos(2.0 * radians(L0))
-    sin_4L0 = sin(4.0 * radians(L0))
-    sin_2M = sin(2.0 * radians(M))
+    # One radians conversion and one sin/cos pair per angle; the 4*L0
+    # and 2*M multiples come from the double-angle identity instead of
+    # extra transcendental calls
+    two_L0_rad = 2.0 * np.deg2rad(L0)
+    sin_2L0 = np.sin(two_L0_rad)
+    cos_2L0 = np.cos(two_L0_rad)
+    sin_4L0 = 2.0 * sin_2L0 * cos_2L0
+    m_rad = np.deg2rad(M)
+    sin_M = np.sin(m_rad)
+    sin_2M = 2.0 * sin_M * np.cos(m_rad)
 
     Etime = (
         y * sin_2L0
@@ -103,18 +135,25 @@ def equation_of_time(julian_century):
         - 0.5 * y * y * sin_4L0
         - 1.25 * e * e * sin_2M
     )
-    return degrees(Etime) * 4.0  # in minutes
+    return np.degrees(Etime) * 4.0  # in minutes
 
 
 def hour_angle(latitude, julian_century, solar_elevation):
-    """Calculate the Hour Angle (in degrees) for given solar elevation."""
-    return degrees(
-        acos(
-            cos(radians(90.0 - solar_elevation))
-            / (cos(radians(latitude)) * cos(radians(sun_declination(julian_century))))
-            - tan(radians(latitude)) * tan(radians(sun_declination(julian_century)))
-        )
-    )
+    """Calculate the Hour Angle (in degrees) for given solar elevation.
+
+    Returns NaN where the sun never reaches the requested elevation
+    (polar day/night), instead of raising.
+    """
+    # Use the declination's sin/cos pair directly instead of converting
+    # the angle back from degrees
+    sin_d, cos_d = _sun_decl_sincos(julian_century)
+    latitude_rad = np.deg2rad(latitude)
+    cos_ha = np.cos(np.deg2rad(90.0 - solar_elevation)) / (
+        np.cos(latitude_rad) * cos_d
+    ) - np.tan(latitude_rad) * sin_d / cos_d
+    # Mask out-of-domain values (polar regions) to NaN instead of raising
+    cos_ha = np.where(np.abs(cos_ha) <= 1.0, cos_ha, np.nan)
+    return np.degrees(np.arccos(cos_ha))
 
 
 def solar_noon(longitude, timezone_offset, julian_day):
@@ -141,6 +180,36 @@ def sunset(latitude, longitude, timezone_offset, julian_day, solar_elevation=-0.
     return solar_noon_time + ha / 15.0  # in hours
 
 
+def noaa_sun_times(latitude, longitude, timezone_offset, dates, solar_elevation=-0.833):
+    """Calculate sunrise, solar noon and sunset for a batch of dates.
+
+    `dates` is anything convertible to a datetime64[D] array (dates,
+    datetimes or date strings). Returns three float64 arrays of local
+    decimal hours; sunrise and sunset are NaN where the sun never
+    reaches the requested elevation (polar day/night).
+    """
+    days = np.asarray(dates, dtype="datetime64[D]")
+    # Julian Day for 12:00 local time on each date: Unix epoch day zero
+    # is JD 2440587.5, plus half a day, shifted to UTC by the offset
+    jd = days.view(np.int64) + (2440587.5 + 0.5) - timezone_offset / 24.0
+
+    jc = julian_century(jd)
+    eq_time = equation_of_time(jc)
+    solar_noons = (720 - 4.0 * longitude - eq_time) / 60.0 + timezone_offset
+
+    # Same hour-angle quantity as hour_angle, phrased so the whole date
+    # axis broadcasts through one arccos call
+    sin_d, cos_d = _sun_decl_sincos(jc)
+    latitude_rad = np.deg2rad(latitude)
+    cos_ha = (np.sin(np.deg2rad(solar_elevation)) - np.sin(latitude_rad) * sin_d) / (
+        np.cos(latitude_rad) * cos_d
+    )
+    cos_ha = np.where(np.abs(cos_ha) <= 1.0, cos_ha, np.nan)
+    half_day = np.degrees(np.arccos(cos_ha)) / 15.0
+
+    return solar_noons - half_day, solar_noons, solar_noons + half_day
+
+
 def date_to_julian_day(target_date, utc_offset=0):
     """Convert a date to Julian Day Number, considering local time."""
     if isinstance(target_date, str):
@@ -183,22 +252,41 @@ def date_to_julian_day(target_date, utc_offset=0):
 
 def decimal_hours_to_time_string(decimal_hours):
     """Convert decimal hours to HH:MM:SS format."""
-    if decimal_hours is None or pd.isna(decimal_hours):
+    if decimal_hours is None or np.isnan(decimal_hours):
         return None
 
-    # Handle negative hours (wrap around midnight)
-    while decimal_hours < 0:
-        decimal_hours += 24
-    while decimal_hours >= 24:
-        decimal_hours -= 24
-
-    hours = int(decimal_hours)
-    minutes = int((decimal_hours - hours) * 60)
-    seconds = int(((decimal_hours - hours) * 60 - minutes) * 60)
+    # A single modulo wraps negative and >= 24h values in constant time
+    # (no while loops); truncation to whole seconds matches the previous
+    # behavior
+    total_seconds = int(decimal_hours % 24.0 * 3600)
+    hours, remainder = divmod(total_seconds, 3600)
+    minutes, seconds = divmod(remainder, 60)
 
     return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
 
 
+def decimal_hours_to_time_array(decimal_hours):
+    """Convert an array of decimal hours to a list of HH:MM:SS strings.
+
+    Vectorized counterpart of decimal_hours_to_time_string: the wrap and
+    divmod arithmetic runs once over the whole array, leaving only the
+    final string formatting in Python. NaN entries come out as None.
+    """
+    values = np.asarray(decimal_hours, dtype=np.float64)
+    nan_mask = np.isnan(values)
+
+    total_seconds = (np.mod(np.where(nan_mask, 0.0, values), 24.0) * 3600).astype(
+        np.int64
+    )
+    hours, remainder = np.divmod(total_seconds, 3600)
+    minutes, seconds = np.divmod(remainder, 60)
+
+    return [
+        None if invalid else f"{h:02d}:{m:02d}:{s:02d}"
+        for invalid, h, m, s in zip(nan_mask, hours, minutes, seconds)
+    ]
+
+
 def yearly_sun_times_dataframe(
     latitude,
     longitude,
@@ -252,21 +340,26 @@ def yearly_sun_times_dataframe(
         - astronomical_sunrise: Astronomical twilight sunrise time (decimal hours)
         - astronomical_sunset: Astronomical twilight sunset time (decimal hours)
     """
+    # Deferred so scalar callers (sunrise/sunset/solar_noon) can import
+    # this module without paying for pandas
+    import pandas as pd
 
     # Use current year if none specified
     if year is None:
         year = date.today().year
 
-    # Helper function to determine timezone offset for a given date
-    def get_timezone_offset_for_date(current_date):
-        # If essential seasonal parameters are not provided, use default timezone_offset
-        if (
-            summer_timezone_offset is None
-            or summer_start_date is None
-            or summer_end_date is None
-        ):
-            return timezone_offset
-
+    # Create the full-year date index in one C-level call instead of a
+    # per-day Python loop of date objects
+    dates = pd.date_range(f"{year}-01-01", f"{year}-12-31", freq="D")
+
+    # Vectorized per-day timezone offsets
+    if (
+        summer_timezone_offset is None
+        or summer_start_date is None
+        or summer_end_date is None
+    ):
+        tz = np.full(len(dates), timezone_offset, dtype=np.float64)
+    else:
         # Use timezone_offset as winter_timezone_offset if not explicitly provided
         effective_winter_offset = (
             winter_timezone_offset
@@ -274,87 +367,51 @@ def yearly_sun_times_dataframe(
             else timezone_offset
         )
 
-        start_month, start_day = summer_start_date
-        end_month, end_day = summer_end_date
-
-        # Create date objects for comparison (using current year)
-        summer_start = date(year, start_month, start_day)
-        summer_end = date(year, end_month, end_day)
+        summer_start = pd.Timestamp(year, *summer_start_date)
+        summer_end = pd.Timestamp(year, *summer_end_date)
 
-        # Handle case where summer period crosses year boundary (e.g., Oct-Mar in Southern Hemisphere)
+        # Handle case where summer period crosses year boundary
+        # (e.g., Oct-Mar in the Southern Hemisphere)
         if summer_start > summer_end:
-            # Summer period spans across New Year (e.g., Oct 1 to Mar 15)
-            if current_date >= summer_start or current_date <= summer_end:
-                return summer_timezone_offset
-            else:
-                return effective_winter_offset
+            in_summer = (dates >= summer_start) | (dates <= summer_end)
         else:
-            # Summer period within same year (e.g., Mar 15 to Oct 1 in Northern Hemisphere)
-            if summer_start <= current_date <= summer_end:
-                return summer_timezone_offset
-            else:
-                return effective_winter_offset
-
-    # Twilight definitions (solar elevation angles in degrees)
-    twilight_angles = {
-        "official": -0.833,  # Sun's center at horizon, accounting for refraction
-        "civil": -6.0,  # Civil twilight
-        "nautical": -12.0,  # Nautical twilight
-        "astronomical": -18.0,  # Astronomical twilight
-    }
+            in_summer = (dates >= summer_start) & (dates <= summer_end)
+
+        tz = np.where(in_summer, summer_timezone_offset, effective_winter_offset)
+        tz = tz.astype(np.float64)
+
+    # Julian Day for 12:00 local time on each date: the DatetimeIndex
+    # midnights plus half a day, shifted to UTC by the per-day offset
+    jd = dates.to_julian_date().to_numpy() + 0.5 - tz / 24.0
 
-    # Create date range for the year
-    start_date = date(year, 1, 1)
-    end_date = date(year, 12, 31)
-
-    # Initialize lists to store results
-    dates = []
-    timezone_offsets = []
-    solar_noons = []
-    results = {f"{twilight}_sunrise": [] for twilight in twilight_angles.keys()}
-    results.update({f"{twilight}_sunset": [] for twilight in twilight_angles.keys()})
-
-    # Calculate for each day of the year
-    current_date = start_date
-    while current_date <= end_date:
-        dates.append(current_date)
-
-        # Determine timezone offset for this date
-        current_timezone_offset = get_timezone_offset_for_date(current_date)
-        timezone_offsets.append(current_timezone_offset)
-
-        julian_day = date_to_julian_day(current_date, current_timezone_offset)
-
-        # Calculate solar noon for this date
-        solar_noon_time = solar_noon(longitude, current_timezone_offset, julian_day)
-        solar_noons.append(solar_noon_time)
-
-        # Calculate sunrise and sunset for each twilight definition
-        for twilight, elevation in twilight_angles.items():
-            try:
-                sunrise_time = sunrise(
-                    latitude, longitude, current_timezone_offset, julian_day, elevation
-                )
-                sunset_time = sunset(
-                    latitude, longitude, current_timezone_offset, julian_day, elevation
-                )
-
-                results[f"{twilight}_sunrise"].append(sunrise_time)
-                results[f"{twilight}_sunset"].append(sunset_time)
-
-            except (ValueError, ZeroDivisionError):
-                # Handle cases where sun doesn't rise/set (polar regions)
-                results[f"{twilight}_sunrise"].append(None)
-                results[f"{twilight}_sunset"].append(None)
-
-        current_date += timedelta(days=1)
-
-    # Create DataFrame
+    jc = julian_century(jd)
+    eq_time = equation_of_time(jc)
+    solar_noons = (720 - 4.0 * longitude - eq_time) / 60.0 + tz
+
+    # Create DataFrame in a single pass
     data = {
         "date": dates,
-        "timezone_offset": timezone_offsets,
+        "timezone_offset": tz,
         "solar_noon": solar_noons,
     }
-    data.update(results)
+
+    # All four twilight angles at once: broadcasting the precomputed
+    # sin(elevation) column against the day axis gives a (4, days)
+    # cosine matrix and a single arccos call covers every hour angle.
+    # cos(ha) = (sin(elev) - sin(lat) sin(decl)) / (cos(lat) cos(decl))
+    # is the same quantity hour_angle computes per elevation, with NaN
+    # marking polar days where the sun never reaches the elevation
+    sin_d, cos_d = _sun_decl_sincos(jc)
+    latitude_rad = np.deg2rad(latitude)
+    cos_ha = (_TWILIGHT_SIN_ELEVATIONS - np.sin(latitude_rad) * sin_d) / (
+        np.cos(latitude_rad) * cos_d
+    )
+    cos_ha = np.where(np.abs(cos_ha) <= 1.0, cos_ha, np.nan)
+    half_day = np.degrees(np.arccos(cos_ha)) / 15.0
+
+    for twilight, half in zip(_TWILIGHT_ANGLES, half_day):
+        data[f"{twilight}_sunrise"] = solar_noons - half
+    for twilight, half in zip(_TWILIGHT_ANGLES, half_day):
+        data[f"{twilight}_sunset"] = solar_noons + half
 
     return pd.DataFrame(data)
@@ -0,0 +1,173 @@
+"""
+Numba-compiled NOAA solar kernel for scalar hot loops.
+
+The helpers from `noaa_solar_calculations` are inlined into a single
+nopython-compatible function so looping callers (e.g. one call per day per
+location) pay one function dispatch instead of ~14, with all trig compiled
+to machine code. When numba is not installed the pure-Python definition is
+used unchanged, so importing this module never fails.
+"""
+
+from math import acos, cos, degrees, radians, sin, tan
+
+import numpy as np
+
+
+def solar_times_kernel(julian_day, latitude, longitude, timezone_offset):
+    """Calculate (sunrise, solar_noon, sunset) in local decimal hours.
+
+    Uses the official solar elevation of -0.833 degrees. The hour-angle
+    argument is clamped to [-1, 1], so polar day/night yields a degenerate
+    zero-length or full-length day instead of raising.
+    """
+    jc = (julian_day - 2451545.0) / 36525.0
+
+    # Geometric mean longitude / anomaly of the sun (degrees)
+    L0 = (280.46646 + jc * (36000.76983 + jc * 0.0003032)) % 360.0
+    M = 357.52911 + jc * (35999.05029 - 0.0001537 * jc)
+
+    # Eccentricity of Earth's orbit
+    e = 0.016708634 - jc * (0.000042037 + 0.0000001267 * jc)
+
+    # Each angle is reduced to radians once and its sin/cos pair computed
+    # once; multiples come from the double/triple-angle identities instead
+    # of extra trig calls
+    m_rad = radians(M)
+    sin_m = sin(m_rad)
+    cos_m = cos(m_rad)
+    sin_2m = 2.0 * sin_m * cos_m
+    sin_3m = sin_m * (3.0 - 4.0 * sin_m * sin_m)
+
+    # Sun's equation of center (degrees)
+    C = (
+        sin_m * (1.914602 - jc * (0.004817 + 0.000014 * jc))
+        + sin_2m * (0.019993 - 0.000101 * jc)
+        + sin_3m * 0.000289
+    )
+
+    # Sun's apparent longitude (degrees)
+    omega_rad = radians(125.04 - 1934.136 * jc)
+    apparent_long = L0 + C - 0.00569 - 0.00478 * sin(omega_rad)
+
+    # Corrected obliquity of the ecliptic (degrees)
+    seconds = 21.448 - jc * (46.8150 + jc * (0.00059 - jc * 0.001813))
+    e0 = 23.0 + (26.0 + (seconds / 60.0)) / 60.0
+    obliq_rad = radians(e0 + 0.00256 * cos(omega_rad))
+
+    # Sun declination: derive cos/tan from sin(declination) directly
+    sint = sin(obliq_rad) * sin(radians(apparent_long))
+    cos_decl = (1.0 - sint * sint) ** 0.5
+    tan_decl = sint / cos_decl
+
+    # var Y via the half-angle identity: tan^2(x/2) = (1-cos x)/(1+cos x)
+    cos_obliq = cos(obliq_rad)
+    y = (1.0 - cos_obliq) / (1.0 + cos_obliq)
+
+    # Equation of time (minutes)
+    L0_rad = radians(L0)
+    sin_L0 = sin(L0_rad)
+    cos_L0 = cos(L0_rad)
+    sin_2L0 = 2.0 * sin_L0 * cos_L0
+    cos_2L0 = 1.0 - 2.0 * sin_L0 * sin_L0
+    sin_4L0 = 2.0 * sin_2L0 * cos_2L0
+    Etime = (
+        y * sin_2L0
+        - 2.0 * e * sin_m
+        + 4.0 * e * y * sin_m * cos_2L0
+        - 0.5 * y * y * sin_4L0
+        - 1.25 * e * e * sin_2m
+    )
+    eq_time = degrees(Etime) * 4.0
+
+    # Hour angle for the official solar elevation (-0.833 degrees)
+    lat_rad = radians(latitude)
+    cos_ha = cos(radians(90.833)) / (cos(lat_rad) * cos_decl) - tan(
+        lat_rad
+    ) * tan_decl
+    if cos_ha > 1.0:
+        cos_ha = 1.0
+    elif cos_ha < -1.0:
+        cos_ha = -1.0
+    ha = degrees(acos(cos_ha))
+
+    solar_noon_time = (720.0 - 4.0 * longitude - eq_time) / 60.0 + timezone_offset
+    sunrise_time = solar_noon_time - ha / 15.0
+    sunset_time = solar_noon_time + ha / 15.0
+
+    return sunrise_time, solar_noon_time, sunset_time
+
+
+def hours_to_hhmm_bytes(values, out):
+    """Write "HH:MM" ASCII records for decimal hours into a (n, 5) buffer.
+
+    Building bytes in a preallocated uint8 buffer keeps the whole loop
+    nopython-compatible; the caller views the buffer as fixed-width
+    strings in one shot afterwards. NaN entries get a 00:00 placeholder
+    for the caller to mask out.
+    """
+    for i in range(values.shape[0]):
+        value = values[i]
+        if value != value:  # NaN
+            total_minutes = 0
+        else:
+            total_minutes = int(value % 24.0 * 60.0 + 0.5) % 1440
+        hours = total_minutes // 60
+        minutes = total_minutes % 60
+        out[i, 0] = 48 + hours // 10
+        out[i, 1] = 48 + hours % 10
+        out[i, 2] = 58  # ':'
+        out[i, 3] = 48 + minutes // 10
+        out[i, 4] = 48 + minutes % 10
+
+
+def solar_times_grid(julian_days, latitudes, longitudes, timezone_offsets):
+    """Evaluate the solar kernel over a full (location, day) grid.
+
+    `julian_days` holds the target dates at 12:00 UTC; the per-location
+    timezone offset is applied as a JD shift inside the loop. Returns
+    three float64 arrays of shape (n_locations, n_days) with sunrise,
+    solar noon and sunset in local decimal hours. Under numba the outer
+    location loop runs in parallel across threads; each (site, day) cell
+    is independent, so the inner day loop writes contiguously.
+    """
+    n_locations = latitudes.shape[0]
+    n_days = julian_days.shape[0]
+
+    sunrise = np.empty((n_locations, n_days))
+    noon = np.empty((n_locations, n_days))
+    sunset = np.empty((n_locations, n_days))
+
+    for i in prange(n_locations):
+        tz = timezone_offsets[i]
+        lat = latitudes[i]
+        lng = longitudes[i]
+        for j in range(n_days):
+            r, n, s = solar_times_kernel(julian_days[j] - tz / 24.0, lat, lng, tz)
+            sunrise[i, j] = r
+            noon[i, j] = n
+            sunset[i, j] = s
+
+    return sunrise, noon, sunset
+
+
+try:
+    from numba import njit, prange
+
+    # Explicit signature forces compilation at import time, so the JIT
+    # warmup cost is paid once instead of on the first call
+    solar_times_kernel = njit(
+        "UniTuple(float64, 3)(float64, float64, float64, float64)",
+        cache=True,
+        fastmath=True,
+        nogil=True,
+    )(solar_times_kernel)
+    # The grid is compiled lazily on first call; parallel=True spreads
+    # the outer location loop over all cores
+    solar_times_grid = njit(cache=True, fastmath=True, parallel=True)(solar_times_grid)
+    hours_to_hhmm_bytes = njit(
+        "void(float64[:], uint8[:, :])", cache=True, nogil=True
+    )(hours_to_hhmm_bytes)
+    NUMBA_AVAILABLE = True
+except ImportError:
+    prange = range
+    NUMBA_AVAILABLE = False
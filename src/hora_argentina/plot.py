@@ -1,24 +1,44 @@
 import math
 from datetime import datetime
 
+import numpy as np
 import pytz
-from bokeh.models import (
-    ColumnDataSource,
-    FuncTickFormatter,
-    HoverTool,
-    Label,
-    Legend,
-    ResetTool,
-    SaveTool,
-    Span,
-    WheelZoomTool,
-)
-from bokeh.plotting import figure
 
 from hora_argentina.timeutils import first_sunday
 
+# Argentina standard time, built once instead of per plot call
+_UTC_MINUS_3 = pytz.FixedOffset(-180)
+
 
 def plot(data_dict, summer_time=False):
+    # Deferred so importing this module does not pay for the full bokeh
+    # API load unless a plot is actually drawn
+    from bokeh.models import (
+        ColumnDataSource,
+        FuncTickFormatter,
+        HoverTool,
+        Label,
+        Legend,
+        ResetTool,
+        SaveTool,
+        Span,
+        WheelZoomTool,
+    )
+    from bokeh.plotting import figure
+
+    # Decimal hours only need minute-level precision on screen, so
+    # float32 halves the payload bokeh serializes for the browser;
+    # missing values become NaN, which bokeh renders as gaps
+    data_dict = {
+        key: values
+        if key == "date"
+        else np.asarray(
+            [np.nan if value is None else value for value in values],
+            dtype=np.float32,
+        )
+        for key, values in data_dict.items()
+    }
+
     source = ColumnDataSource(data=data_dict)
 
     wheel_zoom = WheelZoomTool(dimensions="width")
@@ -108,10 +128,10 @@ def plot(data_dict, summer_time=False):
 
     if summer_time:
         s = datetime.combine(
-            first_sunday(2025, 4), datetime.min.time(), tzinfo=pytz.FixedOffset(-180)
+            first_sunday(2025, 4), datetime.min.time(), tzinfo=_UTC_MINUS_3
         )
         e = datetime.combine(
-            first_sunday(2025, 9), datetime.min.time(), tzinfo=pytz.FixedOffset(-180)
+            first_sunday(2025, 9), datetime.min.time(), tzinfo=_UTC_MINUS_3
         )
 
         dst_start = Span(
@@ -125,16 +145,14 @@ def plot(data_dict, summer_time=False):
         p.add_layout(dst_start)
         p.add_layout(dst_end)
 
-        label = Label(x=s, y=15, text="UTC -4", angle=math.pi / 2, x_offset=25)
-        p.add_layout(label)
-
-        label = Label(x=s, y=15, text="UTC -3", angle=math.pi / 2, x_offset=-10)
-        p.add_layout(label)
-
-        label = Label(x=e, y=15, text="UTC -3", angle=math.pi / 2, x_offset=25)
-        p.add_layout(label)
-
-        label = Label(x=e, y=15, text="UTC -4", angle=math.pi / 2, x_offset=-10)
-        p.add_layout(label)
+        for x_ref, text, x_offset in (
+            (s, "UTC -4", 25),
+            (s, "UTC -3", -10),
+            (e, "UTC -3", 25),
+            (e, "UTC -4", -10),
+        ):
+            p.add_layout(
+                Label(x=x_ref, y=15, text=text, angle=math.pi / 2, x_offset=x_offset)
+            )
 
     return p
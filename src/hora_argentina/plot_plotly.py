@@ -3,24 +3,50 @@ Simple Plotly plotting functions for sunrise/sunset data.
 """
 
 import locale
-from datetime import datetime
 
+import numpy as np
 import pandas as pd
-import plotly.graph_objects as go
 
-# Try to set Spanish locale
-try:
-    locale.setlocale(locale.LC_TIME, "es_ES.UTF-8")
-except locale.Error:
+from hora_argentina.noaa_plotly import _m4_indices, decimal_hours_to_time_strings
+
+# Locale is probed on the first plot call instead of at import time
+_locale_configured = False
+
+
+def _configure_spanish_locale():
+    """Try to set Spanish locale, once per process."""
+    global _locale_configured
+    if _locale_configured:
+        return
+    _locale_configured = True
     try:
-        locale.setlocale(locale.LC_TIME, "es_ES")
+        locale.setlocale(locale.LC_TIME, "es_ES.UTF-8")
     except locale.Error:
-        # Fallback to default if Spanish locale not available
-        pass
+        try:
+            locale.setlocale(locale.LC_TIME, "es_ES")
+        except locale.Error:
+            # Fallback to default if Spanish locale not available
+            pass
+
+# Spanish month abbreviations indexed by month number for vectorized
+# date formatting (index 0 is unused)
+_SPANISH_MONTHS = np.array(
+    ["", "Ene", "Feb", "Mar", "Abr", "May", "Jun",
+     "Jul", "Ago", "Sep", "Oct", "Nov", "Dic"]
+)
+
+# Figure configuration is constant, so it is built once at module scope
+_PLOTLY_CONFIG = {
+    "displayModeBar": True,  # This completely hides the toolbar
+    "staticPlot": False,  # Keep interactivity but hide toolbar,
+    "locale": "es",
+}
 
 
 def plot_sunrise_sunset_curves(
-    df: pd.DataFrame, title: str = "Horarios de Amanecer y Anochecer"
+    df: pd.DataFrame,
+    title: str = "Horarios de Amanecer y Anochecer",
+    max_pts: int = 2000,
 ) -> tuple:
     """
     Create a simple Plotly chart showing sunrise and sunset curves.
@@ -28,10 +54,19 @@ def plot_sunrise_sunset_curves(
     Args:
         df (pd.DataFrame): DataFrame with columns 'date', 'sunrise', 'sunset'
         title (str): Title for the chart
+        max_pts (int): Target point budget for long date ranges; frames
+            well beyond it are downsampled with M4 aggregation before
+            plotting. Pass None to disable downsampling.
 
     Returns:
         tuple: (df_plot, fig, config) - DataFrame, Plotly figure object, and config dict
     """
+    # Deferred so importing this module does not pay for the plotly
+    # package load or the locale probe unless a chart is actually built
+    import plotly.graph_objects as go
+
+    _configure_spanish_locale()
+
     # Ensure we have the required columns
     required_columns = ["date", "sunrise", "sunset"]
     if not all(col in df.columns for col in required_columns):
@@ -56,95 +91,74 @@ def plot_sunrise_sunset_curves(
     # Create a copy to avoid modifying the original
     df_plot = df.copy()
 
-    # Convert time strings to datetime objects for plotting (using dummy date)
-    dummy_date = datetime(2024, 1, 1)  # Same date for all rows to focus on time only
+    def parse_time_column(column):
+        """Parse a whole column of time values into seconds past midnight.
 
-    def parse_time(time_str):
-        """Convert time string to datetime object using dummy date"""
-        if pd.isna(time_str):
-            return None
-        try:
-            # Parse the time string
-            if isinstance(time_str, (pd.Timestamp, datetime)):
-                time_obj = time_str.time()
-            else:
-                time_obj = pd.to_datetime(time_str).time()
-
-            # Combine with dummy date to create datetime for plotting
-            return datetime.combine(dummy_date.date(), time_obj)
-        except Exception:
-            return None
+        One vectorized pd.to_datetime call per column replaces the old
+        per-row parse; unparseable entries coerce to NaN. Numeric
+        seconds keep the columns in compact machine dtypes instead of
+        per-row datetime objects, so the later aggregations and the
+        Plotly payload stay cheap.
+        """
+        parsed = pd.to_datetime(df_plot[column], errors="coerce")
+        return (parsed - parsed.dt.normalize()) / pd.Timedelta(seconds=1)
 
-    df_plot["sunrise_time"] = df_plot["sunrise"].apply(parse_time)
-    df_plot["sunset_time"] = df_plot["sunset"].apply(parse_time)
+    df_plot["sunrise_time"] = parse_time_column("sunrise")
+    df_plot["sunset_time"] = parse_time_column("sunset")
 
     # Parse dawn and dusk times if available
     if has_twilight:
-        df_plot["dawn_time"] = df_plot["dawn"].apply(parse_time)
-        df_plot["dusk_time"] = df_plot["dusk"].apply(parse_time)
+        df_plot["dawn_time"] = parse_time_column("dawn")
+        df_plot["dusk_time"] = parse_time_column("dusk")
 
     # Parse first_light and last_light times if available
     if has_astronomical_twilight:
-        df_plot["first_light_time"] = df_plot["first_light"].apply(parse_time)
-        df_plot["last_light_time"] = df_plot["last_light"].apply(parse_time)
+        df_plot["first_light_time"] = parse_time_column("first_light")
+        df_plot["last_light_time"] = parse_time_column("last_light")
 
     # Parse solar_noon time if available
     if has_solar_noon:
-        df_plot["solar_noon_time"] = df_plot["solar_noon"].apply(parse_time)
+        df_plot["solar_noon_time"] = parse_time_column("solar_noon")
 
-    def adjust_dusk_times_for_midnight_crossing(dt):
+    def adjust_dusk_times_for_midnight_crossing(times):
         """
         Adjust dusk-related times that cross midnight to be represented as 24+ hours.
         For example, 1 AM becomes 25:00, 2 AM becomes 26:00, etc.
-        """
-        if pd.isna(dt) or dt is None:
-            return dt
-
-        # If the time is in the early morning hours (midnight to 6 AM),
-        # assume it's a dusk time that crossed midnight
-        if dt.hour < 6:  # Times from 00:00 to 05:59
-            # Add 24 hours worth of seconds to represent as 24+ hour
-            from datetime import timedelta
 
-            adjusted_dt = dt + timedelta(days=1)
-            return adjusted_dt
-        return dt
+        Vectorized: early-morning entries (00:00 to 05:59) are assumed
+        to be dusk times that crossed midnight and shift forward a day
+        in one masked add; NaN rows are left untouched.
+        """
+        return times.mask(times < 6 * 3600, times + 86400)
 
-    def adjust_dawn_times_for_before_midnight(dt):
+    def adjust_dawn_times_for_before_midnight(times):
         """
         Adjust dawn-related times that occur before midnight to be represented as negative hours.
         For example, 23:00 becomes -1:00, 22:00 becomes -2:00, etc.
-        """
-        if pd.isna(dt) or dt is None:
-            return dt
-
-        # If the time is in the late evening hours (18:00 to 23:59),
-        # assume it's a dawn time that occurs before midnight
-        if dt.hour >= 18:  # Times from 18:00 to 23:59
-            # Subtract 24 hours to represent as negative hour
-            from datetime import timedelta
 
-            adjusted_dt = dt - timedelta(days=1)
-            return adjusted_dt
-        return dt
+        Vectorized: late-evening entries (18:00 to 23:59) are assumed to
+        be dawn times from the previous day and shift back a day in one
+        masked subtract; NaN rows are left untouched.
+        """
+        return times.mask(times >= 18 * 3600, times - 86400)
 
     # Adjust dusk-related times that might cross midnight
     if has_twilight:
-        df_plot["dusk_time"] = df_plot["dusk_time"].apply(
-            adjust_dusk_times_for_midnight_crossing
+        df_plot["dusk_time"] = adjust_dusk_times_for_midnight_crossing(
+            df_plot["dusk_time"]
         )
         # Adjust dawn-related times that might occur before midnight
-        df_plot["dawn_time"] = df_plot["dawn_time"].apply(
-            adjust_dawn_times_for_before_midnight
+        df_plot["dawn_time"] = adjust_dawn_times_for_before_midnight(
+            df_plot["dawn_time"]
         )
 
     if has_astronomical_twilight:
-        df_plot["last_light_time"] = df_plot["last_light_time"].apply(
-            adjust_dusk_times_for_midnight_crossing
+        df_plot["last_light_time"] = adjust_dusk_times_for_midnight_crossing(
+            df_plot["last_light_time"]
         )
         # Adjust first_light times that might occur before midnight
-        df_plot["first_light_time"] = df_plot["first_light_time"].apply(
-            adjust_dawn_times_for_before_midnight
+        df_plot["first_light_time"] = adjust_dawn_times_for_before_midnight(
+            df_plot["first_light_time"]
         )
 
     # Filter out any rows with invalid times
@@ -159,27 +173,51 @@ def plot_sunrise_sunset_curves(
     if df_plot.empty:
         raise ValueError("No valid sunrise/sunset times found in the data")
 
-    # Create Spanish month names mapping
-    spanish_months = {
-        1: "Ene",
-        2: "Feb",
-        3: "Mar",
-        4: "Abr",
-        5: "May",
-        6: "Jun",
-        7: "Jul",
-        8: "Ago",
-        9: "Sep",
-        10: "Oct",
-        11: "Nov",
-        12: "Dic",
-    }
-
-    # Add Spanish formatted date column
-    df_plot["fecha_es"] = df_plot["date"].apply(
-        lambda x: f"{x.day} {spanish_months[x.month]}"
+    # With the NaN rows gone, settle the curve columns into int32: a
+    # quarter of the object-dtype footprint and every later aggregation
+    # runs on a contiguous numeric array
+    for col in required_time_columns:
+        df_plot[col] = df_plot[col].astype(np.int32)
+
+    # For ranges far beyond the plot's pixel width, keep only the union
+    # of each curve's M4 rows (first, min, max and last point per pixel
+    # bin); one shared row subset keeps the fill polygons aligned with
+    # the curves
+    if max_pts is not None and len(df_plot) > 4 * max_pts:
+        keep = np.zeros(len(df_plot), dtype=bool)
+        for col in required_time_columns:
+            keep[_m4_indices(df_plot[col].to_numpy(), max_pts)] = True
+        df_plot = df_plot[keep]
+
+    # Add Spanish formatted date column: the day numbers and the month
+    # lookups into _SPANISH_MONTHS run as vectorized ops instead of a
+    # per-row lambda with a dict access and f-string
+    dates = df_plot["date"].dt
+    df_plot["fecha_es"] = (
+        dates.day.astype(str) + " " + _SPANISH_MONTHS[dates.month.to_numpy()]
     )
 
+    # Feed plotly NumPy arrays instead of tolist() materializations:
+    # every fill polygon shares the same forward-plus-reversed date
+    # outline, the y views are reused across traces, and no per-point
+    # Python objects are built for serialization
+    x_dates = df_plot["date"].to_numpy()
+    x_poly = np.concatenate([x_dates, x_dates[::-1]])
+    time_arrays = {col: df_plot[col].to_numpy() for col in required_time_columns}
+
+    # One min/max pass per time column; the y-axis range and the night
+    # background both read these locals instead of re-scanning the frame
+    # with repeated .isna().all() / .min() / .max() chains
+    day_start = 0
+    day_end = 24 * 3600 - 1
+    column_mins = {}
+    column_maxs = {}
+    for col in required_time_columns:
+        lo = df_plot[col].min()
+        hi = df_plot[col].max()
+        column_mins[col] = day_start if pd.isna(lo) else lo
+        column_maxs[col] = day_start if pd.isna(hi) else hi
+
     # Create the figure
     fig = go.Figure()
 
@@ -187,36 +225,20 @@ def plot_sunrise_sunset_curves(
     # We'll create night areas that extend beyond the twilight periods
     # Night time is considered the time before first_light and after last_light
     if has_astronomical_twilight:
-        # Create times for midnight and end of day for night background
-        midnight_time = datetime.combine(dummy_date.date(), datetime.min.time())
-
         # Calculate the maximum and minimum time range considering adjusted times
-        max_time_in_data = max(
-            [
-                df_plot["last_light_time"].max()
-                if not df_plot["last_light_time"].isna().all()
-                else midnight_time,
-                datetime.combine(
-                    dummy_date.date(), datetime.max.time().replace(microsecond=0)
-                ),
-            ]
-        )
-
-        min_time_in_data = min(
-            [
-                df_plot["first_light_time"].min()
-                if not df_plot["first_light_time"].isna().all()
-                else midnight_time,
-                midnight_time,
-            ]
-        )
+        max_time_in_data = max(column_maxs["last_light_time"], day_end)
+        min_time_in_data = min(column_mins["first_light_time"], day_start)
 
         # Early night (last_light to max time in data or end of day)
         fig.add_trace(
             go.Scatter(
-                x=df_plot["date"].tolist() + df_plot["date"].tolist()[::-1],
-                y=df_plot["last_light_time"].tolist()
-                + [max_time_in_data] * len(df_plot),
+                x=x_poly,
+                y=np.concatenate(
+                    [
+                        time_arrays["last_light_time"],
+                        np.full(len(df_plot), max_time_in_data),
+                    ]
+                ),
                 fill="toself",
                 # fillcolor="#2f454d",
                 fillcolor="rgba(47, 69, 77, 0.8)",
@@ -231,9 +253,13 @@ def plot_sunrise_sunset_curves(
         # Late night (min time in data to first_light)
         fig.add_trace(
             go.Scatter(
-                x=df_plot["date"].tolist() + df_plot["date"].tolist()[::-1],
-                y=[min_time_in_data] * len(df_plot)
-                + df_plot["first_light_time"].tolist()[::-1],
+                x=x_poly,
+                y=np.concatenate(
+                    [
+                        np.full(len(df_plot), min_time_in_data),
+                        time_arrays["first_light_time"][::-1],
+                    ]
+                ),
                 fill="toself",
                 # fillcolor="#2f454d",
                 fillcolor="rgba(47, 69, 77, 0.8)",
@@ -251,9 +277,13 @@ def plot_sunrise_sunset_curves(
         if has_twilight:  # Only add if we also have dawn data
             fig.add_trace(
                 go.Scatter(
-                    x=df_plot["date"].tolist() + df_plot["date"].tolist()[::-1],
-                    y=df_plot["first_light_time"].tolist()
-                    + df_plot["dawn_time"].tolist()[::-1],
+                    x=x_poly,
+                    y=np.concatenate(
+                        [
+                            time_arrays["first_light_time"],
+                            time_arrays["dawn_time"][::-1],
+                        ]
+                    ),
                     fill="toself",
                     # fillcolor="#586a70",
                     fillcolor="rgba(88, 106, 112, 0.8)",
@@ -269,9 +299,13 @@ def plot_sunrise_sunset_curves(
         if has_twilight:  # Only add if we also have dusk data
             fig.add_trace(
                 go.Scatter(
-                    x=df_plot["date"].tolist() + df_plot["date"].tolist()[::-1],
-                    y=df_plot["dusk_time"].tolist()
-                    + df_plot["last_light_time"].tolist()[::-1],
+                    x=x_poly,
+                    y=np.concatenate(
+                        [
+                            time_arrays["dusk_time"],
+                            time_arrays["last_light_time"][::-1],
+                        ]
+                    ),
                     fill="toself",
                     # fillcolor="#586a70",
                     fillcolor="rgba(88, 106, 112, 0.8)",
@@ -288,9 +322,10 @@ def plot_sunrise_sunset_curves(
         # Morning twilight (dawn to sunrise)
         fig.add_trace(
             go.Scatter(
-                x=df_plot["date"].tolist() + df_plot["date"].tolist()[::-1],
-                y=df_plot["dawn_time"].tolist()
-                + df_plot["sunrise_time"].tolist()[::-1],
+                x=x_poly,
+                y=np.concatenate(
+                    [time_arrays["dawn_time"], time_arrays["sunrise_time"][::-1]]
+                ),
                 fill="toself",
                 # fillcolor="#96bbc8",
                 fillcolor="rgba(150, 187, 200, 0.8)",
@@ -305,8 +340,10 @@ def plot_sunrise_sunset_curves(
         # Evening twilight (sunset to dusk)
         fig.add_trace(
             go.Scatter(
-                x=df_plot["date"].tolist() + df_plot["date"].tolist()[::-1],
-                y=df_plot["sunset_time"].tolist() + df_plot["dusk_time"].tolist()[::-1],
+                x=x_poly,
+                y=np.concatenate(
+                    [time_arrays["sunset_time"], time_arrays["dusk_time"][::-1]]
+                ),
                 fill="toself",
                 # fillcolor="#96bbc8",
                 fillcolor="rgba(150, 187, 200, 0.8)",
@@ -321,8 +358,10 @@ def plot_sunrise_sunset_curves(
     # Add filled area between sunrise and sunset (daylight hours)
     fig.add_trace(
         go.Scatter(
-            x=df_plot["date"].tolist() + df_plot["date"].tolist()[::-1],
-            y=df_plot["sunrise_time"].tolist() + df_plot["sunset_time"].tolist()[::-1],
+            x=x_poly,
+            y=np.concatenate(
+                [time_arrays["sunrise_time"], time_arrays["sunset_time"][::-1]]
+            ),
             fill="toself",
             # fillcolor="#b0dae7",
             fillcolor="rgba(176, 218, 231, 0.8)",
@@ -334,43 +373,78 @@ def plot_sunrise_sunset_curves(
         )
     )
 
+    # The line curves render through WebGL; the fill polygons above stay
+    # on SVG Scatter, where "toself" paths are handled reliably. The
+    # numeric-second y values hover through preformatted HH:MM strings
+
     # Add sunrise curve
     fig.add_trace(
-        go.Scatter(
-            x=df_plot["date"],
-            y=df_plot["dawn_time"],
+        go.Scattergl(
+            x=x_dates,
+            y=df_plot["dawn_time"].to_numpy(),
+            customdata=decimal_hours_to_time_strings(
+                df_plot["dawn_time"].to_numpy() / 3600.0
+            ),
             mode="lines",
             name="Amanecer civil",
             line=dict(color="orange", width=3),
-            hovertemplate="<b>%{fullData.name}</b><br>Hora: %{y}<extra></extra>",
+            hovertemplate="<b>%{fullData.name}</b><br>Hora: %{customdata}<extra></extra>",
         )
     )
 
     # Add solar noon curve if available
     if has_solar_noon:
         fig.add_trace(
-            go.Scatter(
-                x=df_plot["date"],
-                y=df_plot["solar_noon_time"],
+            go.Scattergl(
+                x=x_dates,
+                y=df_plot["solar_noon_time"].to_numpy(),
+                customdata=decimal_hours_to_time_strings(
+                    df_plot["solar_noon_time"].to_numpy() / 3600.0
+                ),
                 mode="lines",
                 name="Mediodía solar",
                 line=dict(color="gold", width=2),
-                hovertemplate="<b>%{fullData.name}</b><br>Hora: %{y}<extra></extra>",
+                hovertemplate="<b>%{fullData.name}</b><br>Hora: %{customdata}<extra></extra>",
             )
         )
 
     # Add sunset curve
     fig.add_trace(
-        go.Scatter(
-            x=df_plot["date"],
-            y=df_plot["dusk_time"],
+        go.Scattergl(
+            x=x_dates,
+            y=df_plot["dusk_time"].to_numpy(),
+            customdata=decimal_hours_to_time_strings(
+                df_plot["dusk_time"].to_numpy() / 3600.0
+            ),
             mode="lines",
             name="Anochecer civil",
             line=dict(color="darkred", width=3),
-            hovertemplate="<b>%{fullData.name}</b><br>Hora: %{y}<extra></extra>",
+            hovertemplate="<b>%{fullData.name}</b><br>Hora: %{customdata}<extra></extra>",
         )
     )
 
+    # Numeric seconds need explicit hour ticks; the labels wrap modulo
+    # 24 so adjusted times past midnight still read as clock times
+    yrange_min = min(
+        [
+            column_mins["sunrise_time"],
+            column_mins["sunset_time"],
+            column_mins.get("dawn_time", day_start),
+            column_mins.get("first_light_time", day_start),
+            day_start,
+        ]
+    )
+    yrange_max = max(
+        [
+            column_maxs["sunrise_time"],
+            column_maxs["sunset_time"],
+            column_maxs.get("dusk_time", day_start),
+            column_maxs.get("last_light_time", day_start),
+            day_end,
+        ]
+    )
+    tick_hours = range(int(yrange_min // 3600), int(-(-yrange_max // 3600)) + 1)
+
     # Update layout with Spanish locale
     fig.update_layout(
         # title=dict(text=title, x=0, font=dict(size=12)),
@@ -386,54 +460,12 @@ def plot_sunrise_sunset_curves(
             range=[df_plot["date"].min(), df_plot["date"].max()],
         ),
         yaxis=dict(
-            tickformat="%H:%M",
-            dtick=3600000,  # 1 hour in milliseconds
-            # Set range to accommodate times that might go beyond 24 hours or be negative
-            range=[
-                # Calculate min time from all time columns, allowing for negative times
-                min(
-                    [
-                        df_plot["sunrise_time"].min()
-                        if not df_plot["sunrise_time"].isna().all()
-                        else datetime.combine(dummy_date.date(), datetime.min.time()),
-                        df_plot["sunset_time"].min()
-                        if not df_plot["sunset_time"].isna().all()
-                        else datetime.combine(dummy_date.date(), datetime.min.time()),
-                        df_plot["dawn_time"].min()
-                        if has_twilight and not df_plot["dawn_time"].isna().all()
-                        else datetime.combine(dummy_date.date(), datetime.min.time()),
-                        df_plot["first_light_time"].min()
-                        if has_astronomical_twilight
-                        and not df_plot["first_light_time"].isna().all()
-                        else datetime.combine(dummy_date.date(), datetime.min.time()),
-                        datetime.combine(
-                            dummy_date.date(), datetime.min.time()
-                        ),  # fallback to start of day
-                    ]
-                ),
-                # Calculate max time from all time columns, defaulting to end of day
-                max(
-                    [
-                        df_plot["sunrise_time"].max()
-                        if not df_plot["sunrise_time"].isna().all()
-                        else datetime.combine(dummy_date.date(), datetime.min.time()),
-                        df_plot["sunset_time"].max()
-                        if not df_plot["sunset_time"].isna().all()
-                        else datetime.combine(dummy_date.date(), datetime.min.time()),
-                        df_plot["dusk_time"].max()
-                        if has_twilight and not df_plot["dusk_time"].isna().all()
-                        else datetime.combine(dummy_date.date(), datetime.min.time()),
-                        df_plot["last_light_time"].max()
-                        if has_astronomical_twilight
-                        and not df_plot["last_light_time"].isna().all()
-                        else datetime.combine(dummy_date.date(), datetime.min.time()),
-                        datetime.combine(
-                            dummy_date.date(),
-                            datetime.max.time().replace(microsecond=0),
-                        ),  # fallback to end of day
-                    ]
-                ),
-            ],
+            tickmode="array",
+            tickvals=[hour * 3600 for hour in tick_hours],
+            ticktext=[f"{hour % 24:02d}:00" for hour in tick_hours],
+            # Range accommodates times that go beyond 24 hours or are
+            # negative, from the column aggregates precomputed above
+            range=[yrange_min, yrange_max],
         ),
         hovermode="x unified",
         template="plotly_white",
@@ -448,11 +480,4 @@ def plot_sunrise_sunset_curves(
         dragmode=False,
     )
 
-    # Configuration to hide the toolbar
-    config = {
-        "displayModeBar": True,  # This completely hides the toolbar
-        "staticPlot": False,  # Keep interactivity but hide toolbar,
-        "locale": "es",
-    }
-
-    return df_plot, fig, config
+    return df_plot, fig, _PLOTLY_CONFIG